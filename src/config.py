@@ -5,8 +5,6 @@ load_dotenv()
 
 # --- URLs ---
 BASE_URL = os.getenv("BASE_URL", "https://www.saucedemo.com")
-INVENTORY_URL = f"{BASE_URL}/inventory.html"
-CART_URL = f"{BASE_URL}/cart.html"
 
 # --- Credentials ---
 STANDARD_USER = os.getenv("STANDARD_USER", "standard_user")
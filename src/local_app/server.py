@@ -0,0 +1,61 @@
+import argparse
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that keeps test output free of access logs."""
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalAppServer:
+    """Serve the bundled SauceDemo stand-in over HTTP from a background thread.
+
+    The pages under ``static/`` reproduce the ids and classes the page objects
+    use, so the suite can run against localhost with no internet dependency.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        handler = partial(_QuietHandler, directory=STATIC_DIR)
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the local SauceDemo stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = LocalAppServer(args.host, args.port)
+    print(f"Serving SauceDemo stand-in at {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,470 @@
+// Minimal SauceDemo stand-in. Reproduces the ids, classes and texts the page
+// objects in src/pages rely on; it is not a faithful copy of the real app.
+(function () {
+  "use strict";
+
+  const PRODUCTS = [
+    {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+     desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."},
+    {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+     desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."},
+    {id: 2, name: "Sauce Labs Fleece Jacket", price: 49.99,
+     desc: "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."},
+    {id: 3, name: "Sauce Labs Backpack", price: 29.99,
+     desc: "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+    {id: 4, name: "Sauce Labs Onesie", price: 7.99,
+     desc: "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."},
+    {id: 5, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+     desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard to automate a few tests. Super-soft and comfy ringspun combed cotton."},
+  ];
+
+  const USERS = ["standard_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+  const LOCKED_USERS = ["locked_out_user"];
+  const PASSWORD = "secret_sauce";
+
+  const SESSION_COOKIE = "session-username";
+  const CART_KEY = "cart-contents";
+  const LOGIN_ERROR_KEY = "login-error";
+  const TAX_RATE = 0.08;
+
+  const SORTS = [
+    ["az", "Name (A to Z)", (a, b) => a.name < b.name ? -1 : a.name > b.name ? 1 : 0],
+    ["za", "Name (Z to A)", (a, b) => a.name < b.name ? 1 : a.name > b.name ? -1 : 0],
+    ["lohi", "Price (low to high)", (a, b) => a.price - b.price],
+    ["hilo", "Price (high to low)", (a, b) => b.price - a.price],
+  ];
+
+  // ---------------------------------------------------------------- state
+
+  function sessionUser() {
+    const match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+    return match ? decodeURIComponent(match[1]) : "";
+  }
+
+  function setSessionUser(username) {
+    document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/";
+  }
+
+  function clearSessionUser() {
+    document.cookie = SESSION_COOKIE + "=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+  }
+
+  function cart() {
+    try {
+      return JSON.parse(localStorage.getItem(CART_KEY) || "[]");
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function saveCart(ids) {
+    if (ids.length) {
+      localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    } else {
+      localStorage.removeItem(CART_KEY);
+    }
+    renderBadge();
+  }
+
+  function inCart(id) {
+    return cart().indexOf(id) !== -1;
+  }
+
+  function addToCart(id) {
+    if (!inCart(id)) saveCart(cart().concat([id]));
+  }
+
+  function removeFromCart(id) {
+    saveCart(cart().filter(x => x !== id));
+  }
+
+  function product(id) {
+    return PRODUCTS.find(p => p.id === id);
+  }
+
+  function go(path) {
+    window.location.href = path;
+  }
+
+  // ---------------------------------------------------------------- DOM helpers
+
+  function h(tag, attrs, children) {
+    const el = document.createElement(tag);
+    Object.entries(attrs || {}).forEach(([key, value]) => {
+      if (key === "onclick" || key === "onchange" || key === "onsubmit") {
+        el[key] = value;
+      } else if (key === "text") {
+        el.textContent = value;
+      } else {
+        el.setAttribute(key, value);
+      }
+    });
+    (children || []).forEach(child => {
+      if (child) el.appendChild(typeof child === "string" ? document.createTextNode(child) : child);
+    });
+    return el;
+  }
+
+  function slug(name) {
+    return name.toLowerCase().replace(/\s+/g, "-");
+  }
+
+  function money(cents) {
+    return "$" + (cents / 100).toFixed(2);
+  }
+
+  function cents(price) {
+    return Math.round(price * 100);
+  }
+
+  // ---------------------------------------------------------------- shared chrome
+
+  function menu() {
+    const wrap = h("div", {"class": "bm-menu-wrap", "aria-hidden": "true"}, [
+      h("div", {"class": "bm-menu"}, [
+        h("nav", {"class": "bm-item-list"}, [
+          h("a", {"id": "inventory_sidebar_link", "class": "bm-item menu-item", "href": "#",
+                  "text": "All Items", onclick: e => { e.preventDefault(); go("/inventory.html"); }}),
+          h("a", {"id": "about_sidebar_link", "class": "bm-item menu-item",
+                  "href": "https://saucelabs.com/", "text": "About"}),
+          h("a", {"id": "logout_sidebar_link", "class": "bm-item menu-item", "href": "#",
+                  "text": "Logout", onclick: e => { e.preventDefault(); clearSessionUser(); go("/"); }}),
+          h("a", {"id": "reset_sidebar_link", "class": "bm-item menu-item", "href": "#",
+                  "text": "Reset App State", onclick: e => { e.preventDefault(); resetAppState(); }}),
+        ]),
+      ]),
+      h("div", {"class": "bm-cross-button"}, [
+        h("button", {"id": "react-burger-cross-btn", "type": "button", "text": "Close Menu",
+                     onclick: () => wrap.setAttribute("aria-hidden", "true")}),
+      ]),
+    ]);
+
+    return h("div", {"id": "menu_button_container"}, [
+      h("div", {"class": "bm-burger-button"}, [
+        h("button", {"id": "react-burger-menu-btn", "type": "button", "text": "Open Menu",
+                     onclick: () => wrap.setAttribute("aria-hidden", "false")}),
+      ]),
+      wrap,
+    ]);
+  }
+
+  function resetAppState() {
+    saveCart([]);
+    document.querySelectorAll("button.btn_inventory").forEach(btn => {
+      const id = Number(btn.getAttribute("data-product-id"));
+      setCartButton(btn, product(id), false);
+    });
+  }
+
+  function renderBadge() {
+    const link = document.querySelector(".shopping_cart_link");
+    if (!link) return;
+    const count = cart().length;
+    let badge = link.querySelector(".shopping_cart_badge");
+    if (!count) {
+      if (badge) badge.remove();
+      return;
+    }
+    if (!badge) {
+      badge = h("span", {"class": "shopping_cart_badge"});
+      link.appendChild(badge);
+    }
+    badge.textContent = String(count);
+  }
+
+  function header(title, extra) {
+    return h("div", {"id": "header_container", "class": "header_container"}, [
+      h("div", {"class": "primary_header"}, [
+        menu(),
+        h("div", {"class": "header_label"}, [h("div", {"class": "app_logo", "text": "Swag Labs"})]),
+        h("div", {"id": "shopping_cart_container", "class": "shopping_cart_container"}, [
+          h("a", {"class": "shopping_cart_link", onclick: () => go("/cart.html")}),
+        ]),
+      ]),
+      h("div", {"class": "header_secondary_container"}, [
+        h("span", {"class": "title", "text": title}),
+        extra,
+      ]),
+    ]);
+  }
+
+  function page(title, body, extra) {
+    const root = document.getElementById("root");
+    root.replaceChildren(
+      h("div", {"id": "page_wrapper", "class": "page_wrapper"}, [
+        h("div", {"id": "contents_wrapper"}, [header(title, extra), body]),
+      ])
+    );
+    renderBadge();
+  }
+
+  // Inventory tiles use slugged ids (add-to-cart-sauce-labs-onesie); the PDP uses plain ones
+  function setCartButton(btn, item, added) {
+    const suffix = btn.getAttribute("data-slugged") ? "-" + slug(item.name) : "";
+    btn.id = (added ? "remove" : "add-to-cart") + suffix;
+    btn.textContent = added ? "Remove" : "Add to cart";
+    btn.className = "btn " + (added ? "btn_secondary" : "btn_primary") + " btn_small btn_inventory";
+  }
+
+  function cartButton(item, slugged) {
+    const btn = h("button", {"data-product-id": String(item.id)});
+    if (slugged) btn.setAttribute("data-slugged", "true");
+    setCartButton(btn, item, inCart(item.id));
+    btn.onclick = () => {
+      const added = !inCart(item.id);
+      if (added) addToCart(item.id); else removeFromCart(item.id);
+      setCartButton(btn, item, added);
+    };
+    return btn;
+  }
+
+  function itemRow(item, withRemove) {
+    return h("div", {"class": "cart_item"}, [
+      h("div", {"class": "cart_quantity", "text": "1"}),
+      h("div", {"class": "cart_item_label"}, [
+        h("a", {"id": "item_" + item.id + "_title_link", "href": "#",
+                onclick: e => { e.preventDefault(); go("/inventory-item.html?id=" + item.id); }}, [
+          h("div", {"class": "inventory_item_name", "text": item.name}),
+        ]),
+        h("div", {"class": "inventory_item_desc", "text": item.desc}),
+        h("div", {"class": "item_pricebar"}, [
+          h("div", {"class": "inventory_item_price", "text": money(cents(item.price))}),
+          withRemove && h("button", {
+            "id": "remove-" + slug(item.name),
+            "class": "btn btn_secondary btn_small cart_button",
+            "text": "Remove",
+            onclick: e => { removeFromCart(item.id); e.target.closest(".cart_item").remove(); },
+          }),
+        ]),
+      ]),
+    ]);
+  }
+
+  function cartItems() {
+    return cart().map(product).filter(Boolean);
+  }
+
+  // ---------------------------------------------------------------- pages
+
+  function loginPage() {
+    const error = sessionStorage.getItem(LOGIN_ERROR_KEY) || "";
+    sessionStorage.removeItem(LOGIN_ERROR_KEY);
+
+    const errorBox = h("div", {"class": "error-message-container"});
+    const showError = message => {
+      errorBox.className = "error-message-container error";
+      errorBox.replaceChildren(h("h3", {"data-test": "error"}, [
+        message,
+        h("button", {"class": "error-button", "type": "button",
+                     onclick: () => { errorBox.className = "error-message-container"; errorBox.replaceChildren(); }}),
+      ]));
+    };
+
+    const username = h("input", {"id": "user-name", "name": "user-name", "class": "input_error form_input",
+                                 "placeholder": "Username", "type": "text", "data-test": "username"});
+    const password = h("input", {"id": "password", "name": "password", "class": "input_error form_input",
+                                 "placeholder": "Password", "type": "password", "data-test": "password"});
+
+    const form = h("form", {onsubmit: e => {
+      e.preventDefault();
+      if (!username.value) return showError("Epic sadface: Username is required");
+      if (!password.value) return showError("Epic sadface: Password is required");
+      if (LOCKED_USERS.indexOf(username.value) !== -1 && password.value === PASSWORD) {
+        return showError("Epic sadface: Sorry, this user has been locked out.");
+      }
+      if (USERS.indexOf(username.value) === -1 || password.value !== PASSWORD) {
+        return showError("Epic sadface: Username and password do not match any user in this service");
+      }
+      setSessionUser(username.value);
+      go("/inventory.html");
+    }}, [
+      h("div", {"class": "form_group"}, [username]),
+      h("div", {"class": "form_group"}, [password]),
+      errorBox,
+      h("input", {"type": "submit", "class": "submit-button btn_action", "id": "login-button",
+                  "name": "login-button", "value": "Login", "data-test": "login-button"}),
+    ]);
+
+    document.getElementById("root").replaceChildren(
+      h("div", {"class": "login_container"}, [
+        h("div", {"class": "login_logo", "text": "Swag Labs"}),
+        h("div", {"class": "login_wrapper"}, [form]),
+      ])
+    );
+    if (error) showError(error);
+  }
+
+  function inventoryPage() {
+    const list = h("div", {"class": "inventory_list"});
+    const active = h("span", {"class": "active_option"});
+    const select = h("select", {"class": "product_sort_container", "data-test": "product-sort-container"},
+      SORTS.map(([value, label]) => h("option", {"value": value, "text": label})));
+
+    const renderList = () => {
+      const sort = SORTS.find(([value]) => value === select.value) || SORTS[0];
+      active.textContent = sort[1];
+      list.replaceChildren(...PRODUCTS.slice().sort(sort[2]).map(item => {
+        const open = e => { e.preventDefault(); go("/inventory-item.html?id=" + item.id); };
+        return h("div", {"class": "inventory_item"}, [
+          h("div", {"class": "inventory_item_img"}, [
+            h("a", {"id": "item_" + item.id + "_img_link", "href": "#", onclick: open}, [
+              h("img", {"alt": item.name, "class": "inventory_item_img", "src": "/img/product.svg"}),
+            ]),
+          ]),
+          h("div", {"class": "inventory_item_description"}, [
+            h("div", {"class": "inventory_item_label"}, [
+              h("a", {"id": "item_" + item.id + "_title_link", "href": "#", onclick: open}, [
+                h("div", {"class": "inventory_item_name", "text": item.name}),
+              ]),
+              h("div", {"class": "inventory_item_desc", "text": item.desc}),
+            ]),
+            h("div", {"class": "pricebar"}, [
+              h("div", {"class": "inventory_item_price", "text": money(cents(item.price))}),
+              cartButton(item, true),
+            ]),
+          ]),
+        ]);
+      }));
+    };
+    select.onchange = renderList;
+
+    page("Products", h("div", {"id": "inventory_container", "class": "inventory_container"}, [list]),
+      h("div", {"class": "right_component"}, [h("span", {"class": "select_container"}, [active, select])]));
+    renderList();
+  }
+
+  function pdpPage() {
+    const id = Number(new URLSearchParams(window.location.search).get("id"));
+    const item = product(id);
+    const back = h("button", {"id": "back-to-products", "class": "btn btn_secondary back btn_large inventory_details_back_button",
+                              "text": "Back to products", onclick: () => go("/inventory.html")});
+
+    const details = item
+      ? h("div", {"class": "inventory_details_container"}, [
+          h("img", {"alt": item.name, "class": "inventory_details_img", "src": "/img/product.svg"}),
+          h("div", {"class": "inventory_details_desc_container"}, [
+            h("div", {"class": "inventory_details_name large_size", "text": item.name}),
+            h("div", {"class": "inventory_details_desc large_size", "text": item.desc}),
+            h("div", {"class": "inventory_details_price", "text": money(cents(item.price))}),
+            cartButton(item, false),
+          ]),
+        ])
+      : h("div", {"class": "inventory_details_container"}, [
+          h("div", {"class": "inventory_details_desc_container"}, [
+            h("div", {"class": "inventory_details_name large_size", "text": "ITEM NOT FOUND"}),
+            h("div", {"class": "inventory_details_desc large_size",
+                      "text": "We're sorry, but your call could not be completed as dialled."}),
+          ]),
+        ]);
+
+    page("", h("div", {"class": "inventory_details"}, [back, details]));
+  }
+
+  function cartPage() {
+    const list = h("div", {"class": "cart_list"}, [
+      h("div", {"class": "cart_quantity_label", "text": "QTY"}),
+      h("div", {"class": "cart_desc_label", "text": "Description"}),
+    ].concat(cartItems().map(item => itemRow(item, true))));
+
+    page("Your Cart", h("div", {"id": "cart_contents_container", "class": "cart_contents_container"}, [
+      list,
+      h("div", {"class": "cart_footer"}, [
+        h("button", {"id": "continue-shopping", "class": "btn btn_secondary back btn_medium",
+                     "text": "Continue Shopping", onclick: () => go("/inventory.html")}),
+        h("button", {"id": "checkout", "class": "btn btn_action btn_medium checkout_button",
+                     "text": "Checkout", onclick: () => go("/checkout-step-one.html")}),
+      ]),
+    ]));
+  }
+
+  function checkoutStepOnePage() {
+    const errorBox = h("div", {"class": "error-message-container"});
+    const field = (id, placeholder) => h("input", {"id": id, "name": id, "class": "input_error form_input",
+                                                   "placeholder": placeholder, "type": "text"});
+    const first = field("first-name", "First Name");
+    const last = field("last-name", "Last Name");
+    const postal = field("postal-code", "Zip/Postal Code");
+
+    const form = h("form", {onsubmit: e => {
+      e.preventDefault();
+      const missing = !first.value ? "First Name" : !last.value ? "Last Name" : !postal.value ? "Postal Code" : "";
+      if (missing) {
+        errorBox.className = "error-message-container error";
+        errorBox.replaceChildren(h("h3", {"data-test": "error"}, ["Error: " + missing + " is required"]));
+        return;
+      }
+      go("/checkout-step-two.html");
+    }}, [
+      h("div", {"class": "checkout_info"}, [
+        h("div", {"class": "form_group"}, [first]),
+        h("div", {"class": "form_group"}, [last]),
+        h("div", {"class": "form_group"}, [postal]),
+        errorBox,
+      ]),
+      h("div", {"class": "checkout_buttons"}, [
+        h("button", {"id": "cancel", "type": "button", "class": "btn btn_secondary back btn_medium cart_cancel_link",
+                     "text": "Cancel", onclick: () => go("/cart.html")}),
+        h("input", {"id": "continue", "type": "submit", "class": "submit-button btn btn_primary cart_button btn_action",
+                    "value": "Continue"}),
+      ]),
+    ]);
+
+    page("Checkout: Your Information",
+      h("div", {"id": "checkout_info_container", "class": "checkout_info_container"}, [form]));
+  }
+
+  function checkoutStepTwoPage() {
+    const items = cartItems();
+    const subtotal = items.reduce((sum, item) => sum + cents(item.price), 0);
+    const tax = Math.round(subtotal * TAX_RATE);
+
+    page("Checkout: Overview", h("div", {"id": "checkout_summary_container", "class": "checkout_summary_container"}, [
+      h("div", {"class": "cart_list"}, [
+        h("div", {"class": "cart_quantity_label", "text": "QTY"}),
+        h("div", {"class": "cart_desc_label", "text": "Description"}),
+      ].concat(items.map(item => itemRow(item, false)))),
+      h("div", {"class": "summary_info"}, [
+        h("div", {"class": "summary_subtotal_label", "text": "Item total: " + money(subtotal)}),
+        h("div", {"class": "summary_tax_label", "text": "Tax: " + money(tax)}),
+        h("div", {"class": "summary_info_label summary_total_label", "text": "Total: " + money(subtotal + tax)}),
+        h("div", {"class": "cart_footer"}, [
+          h("button", {"id": "cancel", "class": "btn btn_secondary back btn_medium cart_cancel_link",
+                       "text": "Cancel", onclick: () => go("/cart.html")}),
+          h("button", {"id": "finish", "class": "btn btn_action btn_medium cart_button",
+                       "text": "Finish", onclick: () => { saveCart([]); go("/checkout-complete.html"); }}),
+        ]),
+      ]),
+    ]));
+  }
+
+  function checkoutCompletePage() {
+    page("Checkout: Complete!", h("div", {"id": "checkout_complete_container", "class": "checkout_complete_container"}, [
+      h("h2", {"class": "complete-header", "text": "Thank you for your order!"}),
+      h("div", {"class": "complete-text",
+                "text": "Your order has been dispatched, and will arrive just as fast as the pony can get there!"}),
+      h("button", {"id": "back-to-products", "class": "btn btn_primary btn_small",
+                   "text": "Back Home", onclick: () => go("/inventory.html")}),
+    ]));
+  }
+
+  // ---------------------------------------------------------------- routing
+
+  const PAGES = {
+    "login": loginPage,
+    "inventory": inventoryPage,
+    "pdp": pdpPage,
+    "cart": cartPage,
+    "checkout-step-one": checkoutStepOnePage,
+    "checkout-step-two": checkoutStepTwoPage,
+    "checkout-complete": checkoutCompletePage,
+  };
+
+  const name = document.body.getAttribute("data-page");
+  if (name !== "login" && !sessionUser()) {
+    sessionStorage.setItem(LOGIN_ERROR_KEY,
+      "Epic sadface: You can only access '" + window.location.pathname + "' when you are logged in.");
+    window.location.replace("/");
+  } else {
+    PAGES[name]();
+  }
+})();
@@ -1,91 +1,386 @@
-import os
-from datetime import datetime
+import time
+
 from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
     StaleElementReferenceException,
     TimeoutException,
     NoSuchElementException,
 )
 from selenium.webdriver.support.select import Select
-from src.utils.waits import wait_clickable, wait_visible
+from src.config import BASE_URL
+from src.utils.artifacts import capture_failure
+from src.utils.element_cache import element_cache
+from src.utils.instrumentation import operation_metrics
+from src.utils.retry import DEFAULT_RETRY, RetryPolicy
+from src.utils.waits import (
+    FIND_JS,
+    presence_located,
+    settled_visible,
+    wait_clickable,
+    wait_until,
+    wait_visible,
+)
 
 
 class BasePage:
 
-    SCREENSHOTS_DIR = "screenshots"
+    # Retry policy for click/type/ele_text/dropdowns; override per page class or instance
+    retry_policy: RetryPolicy = DEFAULT_RETRY
+
+    # Errors that mean a reused handle is no longer usable as-is; the operation
+    # then falls back to a fresh wait without spending a retry
+    _HANDLE_ERRORS = (
+        StaleElementReferenceException,
+        ElementNotInteractableException,
+        ElementClickInterceptedException,
+    )
+
+    # Builds a name -> element index for repeated items (inventory tiles, cart rows).
+    # A per-document token plus a mutation counter for the item class lets later
+    # lookups detect navigation or re-rendering without rescanning the DOM.
+    _INDEX_SCRIPT = """
+        const [itemClass, nameClass] = arguments;
+        window.__pageToken = window.__pageToken || Math.random().toString(36).slice(2);
+        window.__itemMutations = window.__itemMutations || {};
+        if (!(itemClass in window.__itemMutations)) {
+            window.__itemMutations[itemClass] = 0;
+            const touches = n => n.nodeType === 1 && (
+                n.classList.contains(itemClass) || n.getElementsByClassName(itemClass).length > 0);
+            new MutationObserver(records => {
+                if (records.some(r => [...r.addedNodes, ...r.removedNodes].some(touches))) {
+                    window.__itemMutations[itemClass]++;
+                }
+            }).observe(document.body, {childList: true, subtree: true});
+        }
+        const items = Array.from(document.getElementsByClassName(itemClass), item => {
+            const name = item.getElementsByClassName(nameClass)[0];
+            return [name ? name.innerText.trim() : '', item];
+        });
+        return [[window.__pageToken, window.__itemMutations[itemClass]], items];
+    """
+    _INDEX_STATE_SCRIPT = """
+        const itemClass = arguments[0];
+        return [window.__pageToken || null, (window.__itemMutations || {})[itemClass] ?? null];
+    """
+    # Clicks the button inside each named item (exact name, then substring, as
+    # find_indexed_item). Each target is resolved against the live DOM right before its
+    # click, so rows an earlier click re-rendered or removed are never clicked stale.
+    _BATCH_CLICK_SCRIPT = """
+        const [itemClass, nameClass, buttonSelector, label, names] = arguments;
+        const norm = s => s.split(/\\s+/).filter(Boolean).join(' ').toLowerCase();
+        const find = requested => {
+            const key = norm(requested);
+            const items = Array.from(document.getElementsByClassName(itemClass), item => {
+                const name = item.getElementsByClassName(nameClass)[0];
+                return [norm(name ? name.innerText : ''), item];
+            });
+            const match = items.find(([name]) => name === key) || items.find(([name]) => name.includes(key));
+            return match ? match[1] : null;
+        };
+        return names.map(requested => {
+            const item = find(requested);
+            const button = item && item.querySelector(buttonSelector);
+            if (!button || !button.isConnected) return false;
+            if (label !== null && button.innerText.trim() !== label) return false;
+            button.click();
+            return true;
+        });
+    """
 
-    def __init__(self, driver):
+    # Selects by option value with the native setter plus a bubbling change event (what
+    # React listens for). The option list is returned only when the page token differs
+    # from the caller's cached one; then the value is resolved from `text` in the page.
+    _SELECT_SCRIPT = FIND_JS + """
+        const [by, selector, token, value, text] = arguments;
+        window.__pageToken = window.__pageToken || Math.random().toString(36).slice(2);
+        const el = findAll(by, selector)[0];
+        if (!el) return null;
+        const fresh = window.__pageToken !== token;
+        const options = fresh ? Array.from(el.options, o => [o.text.trim(), o.value]) : null;
+        const target = fresh ? (options.find(([label]) => label === text) || [])[1] : value;
+        let selected = false;
+        if (target !== undefined && target !== null) {
+            const setter = Object.getOwnPropertyDescriptor(HTMLSelectElement.prototype, 'value').set;
+            setter.call(el, target);
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+            selected = el.value === target;
+        }
+        return [window.__pageToken, options, selected];
+    """
+    _SELECTED_TEXT_SCRIPT = FIND_JS + """
+        const el = findAll(arguments[0], arguments[1])[0];
+        if (!el) return null;
+        const option = el.options[el.selectedIndex];
+        return option ? option.text.trim() : '';
+    """
+
+    def __init__(self, driver, base_url=BASE_URL):
         self.driver = driver
-        os.makedirs(self.SCREENSHOTS_DIR, exist_ok=True)
+        self.base_url = base_url.rstrip("/")
+        self._item_indexes = {}
+        self._dropdown_options = {}
 
 
     def _screenshot(self, label: str) -> str:
-        """Save a failure screenshot with a timestamp and return its path."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        filename = f"{self.SCREENSHOTS_DIR}/fail_{label}_{timestamp}.png"
-        self.driver.save_screenshot(filename)
-        return filename
+        """Queue a failure bundle (screenshot, DOM, console log) and return its directory.
 
+        Only the WebDriver reads happen here; files are written in the background.
+        """
+        return capture_failure(self.driver, label)
 
-    def click(self, by, selector):
-        try:
-            el = wait_clickable(self.driver, (by, selector))
-            el.click()
 
-        except StaleElementReferenceException:
-            # Re-find and try once more if the DOM refreshed
-            el = wait_clickable(self.driver, (by, selector))
-            el.click()
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        # Must agree with norm() in _BATCH_CLICK_SCRIPT: str.lower() and JS toLowerCase()
+        # apply the same Unicode mapping, casefold() does not (e.g. "ß" -> "ss")
+        return " ".join(name.split()).lower()
 
-        except TimeoutException:
-            self._screenshot(selector)
-            raise TimeoutException(
-                f"Element not clickable with locator: ({by}, {selector})"
+    def _item_index(self, item_class: str, name_class: str) -> dict:
+        """Return the cached name -> element index, rebuilding it after navigation or re-render."""
+        cached = self._item_indexes.get(item_class)
+        if cached:
+            state = self.driver.execute_script(self._INDEX_STATE_SCRIPT, item_class)
+            if state[0] is not None and state == cached[0]:
+                return cached[1]
+
+        state, items = self.driver.execute_script(self._INDEX_SCRIPT, item_class, name_class)
+        index = {}
+        for name, element in items:
+            index.setdefault(self._normalize_name(name), element)
+        self._item_indexes[item_class] = (state, index)
+        return index
+
+    def _invalidate_item_index(self, item_class: str):
+        self._item_indexes.pop(item_class, None)
+
+    def find_indexed_item(self, item_class: str, name_class: str, item_name: str):
+        """Return the item element whose name matches (case-insensitive), or None.
+
+        An exact name is an O(1) dict hit; a partial name such as "Jacket" falls
+        back to a substring match over the cached names in DOM order.
+        """
+        index = self._item_index(item_class, name_class)
+        key = self._normalize_name(item_name)
+        if key in index:
+            return index[key]
+        return next((el for name, el in index.items() if key in name), None)
+
+    def click_item_buttons(
+        self, item_class: str, name_class: str, button_selector: str, names, label=None
+    ) -> dict[str, bool]:
+        """Click the button inside each named item in one script call.
+
+        Items are matched like ``find_indexed_item``, each against the DOM as
+        left by the clicks before it. With ``label`` set, a button whose text
+        differs (e.g. already toggled) is skipped. Returns {name: clicked} in
+        the order given; False for a name with no attached button.
+        """
+        names = list(names)
+        clicked = self.driver.execute_script(
+            self._BATCH_CLICK_SCRIPT, item_class, name_class, button_selector, label, names
+        )
+        return dict(zip(names, clicked))
+
+    def _reusable_handle(self, locator, reuse):
+        """Return the cached element at ``locator`` if the cache probe finds it in the ``reuse`` state.
+
+        ``reuse`` is "visible" or "clickable" (visible and enabled), the state
+        the operation's wait would have checked; None never reuses.
+        """
+        if reuse is None:
+            return None
+        cached = element_cache(self.driver).lookup(self.driver, locator)
+        if not cached:
+            return None
+        element, visible, enabled = cached
+        if not visible or (reuse == "clickable" and not enabled):
+            return None
+        return element
+
+    def _operate(self, name: str, locator, wait, action, failure: str,
+                 reuse=None, policy: RetryPolicy = None):
+        """Run ``action(element)`` on the element at ``locator`` under a retry policy.
+
+        The element comes from ``wait`` (e.g. ``wait_clickable``). If the
+        element cache already holds one for ``locator`` (an earlier operation
+        or lookup), it is reused instead, provided the cache probe confirms it
+        is still attached, still the locator's first match and in the
+        ``reuse`` state ``wait`` would have checked. Without ``reuse`` no
+        handle is reused. A reused handle that turns out stale or blocked is
+        dropped for a fresh wait at no retry cost. Errors in ``policy.retry_on`` re-resolve
+        the element after a jittered backoff. Every failure is recorded and
+        queues a failure bundle before raising: a wait timing out as
+        ``TimeoutException(failure)``, anything else unchanged.
+        """
+        policy = policy or self.retry_policy
+        start = time.perf_counter()
+        retries = 0
+        reused = False
+
+        def finish(failed):
+            operation_metrics(self.driver).record(
+                name, time.perf_counter() - start, retries, reused, failed
             )
 
+        while True:
+            element = self._reusable_handle(locator, reuse)
+            from_cache = element is not None
+            reused = reused or from_cache
+
+            try:
+                if element is None:
+                    element = wait(self.driver, locator)
+                result = action(element)
+
+            except TimeoutException:
+                finish(failed=True)
+                self._screenshot(locator[1])
+                raise TimeoutException(failure)
+
+            except Exception as error:
+                if from_cache and isinstance(error, self._HANDLE_ERRORS):
+                    element_cache(self.driver).discard(locator)
+                    continue
+                if isinstance(error, policy.retry_on) and retries + 1 < policy.attempts:
+                    retries += 1
+                    policy.pause(retries)
+                    continue
+                finish(failed=True)
+                self._screenshot(locator[1])
+                raise
+
+            element_cache(self.driver).store(locator, element)
+            finish(failed=False)
+            return result
+
+    def click(self, by, selector):
+        self._operate(
+            "click", (by, selector), wait_clickable, lambda el: el.click(),
+            f"Element not clickable with locator: ({by}, {selector})",
+            reuse="clickable",
+        )
+
     def type(self, by, selector, text):
-        try:
-            el = wait_visible(self.driver, (by, selector))
+        def clear_and_type(el):
             el.clear()
             el.send_keys(text)
             return el
 
-        except TimeoutException:
-            self._screenshot(selector)
-            raise TimeoutException(
-                f"Element not visible with locator: ({by}, {selector})"
-            )
+        return self._operate(
+            "type", (by, selector), wait_visible, clear_and_type,
+            f"Element not visible with locator: ({by}, {selector})",
+            reuse="visible",
+        )
 
-    def navigate_url(self, url):
-        self.driver.get(url)
+    def navigate_url(self, url, ready=None, timeout=5):
+        """Navigate to url; with an eager/none page-load strategy also wait for ``ready``.
 
+        ``ready`` is the locator that marks the destination as usable (e.g. the
+        inventory tiles). Under the default "normal" strategy ``driver.get`` has
+        already waited for the full load, so no extra wait is made. If the locator
+        never appears (e.g. a redirect to login) the call returns without raising.
+        """
+        strategy = self.driver.caps.get("pageLoadStrategy", "normal")
+        if ready is None or strategy == "normal":
+            element_cache(self.driver).clear()
+            self.driver.get(url)
+            return
+
+        if strategy == "none":
+            # driver.get returns before the old document unloads; tag it so it
+            # cannot be mistaken for the new page
+            self.driver.execute_script("window.__navigatingAway = true;")
+        element_cache(self.driver).clear()
+        self.driver.get(url)
 
-    def ele_text(self, by, selector) -> str:
-        """Return element text, or raise TimeoutException on failure."""
         try:
-            el = wait_visible(self.driver, (by, selector))
-            return el.text
+            if strategy == "none":
+                wait_until(
+                    self.driver,
+                    lambda d: not d.execute_script("return !!window.__navigatingAway;"),
+                    timeout,
+                    label=f"navigation to {url}",
+                )
+            presence_located(self.driver, ready, timeout=timeout)
 
         except TimeoutException:
-            self._screenshot(selector)
-            raise TimeoutException(
-                f"Element not visible with locator: ({by}, {selector})"
-            )
+            pass
+
+    def reset_browser_state(self):
+        """Drop cookies and web storage for the current origin (session + cart state)."""
+        self.driver.delete_all_cookies()
+        self.driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+
+
+    def ele_text(self, by, selector) -> str:
+        """Return element text, or raise TimeoutException on failure."""
+        return self._operate(
+            "ele_text", (by, selector), wait_visible, lambda el: el.text,
+            f"Element not visible with locator: ({by}, {selector})",
+            reuse="visible",
+        )
 
     def ele_visible(self, by, selector, timeout=5):
-        """Return the element if visible within timeout, otherwise False."""
+        """Return the element if visible within timeout, otherwise False.
+
+        A cached element that is still current and visible is returned after
+        one probe, with no wait.
+        """
+        cache = element_cache(self.driver)
+        cached = cache.lookup(self.driver, (by, selector))
+        if cached and cached[1]:
+            return cached[0]
         try:
-            return wait_visible(self.driver, (by, selector), timeout=timeout)
+            el = wait_visible(self.driver, (by, selector), timeout=timeout)
 
         except TimeoutException:
             return False
+        cache.store((by, selector), el)
+        return el
+
+    def ele_settled(self, by, selector, timeout=5):
+        """Return the element if visible once the page has settled, otherwise False.
+
+        Unlike ``ele_visible``, a missing element answers False as soon as the
+        document has loaded and pending renders have painted, not after the
+        full timeout. Use it for elements that show up right after an action or
+        not at all (validation errors).
+        """
+        return settled_visible(self.driver, (by, selector), timeout=timeout) or False
+
+    def ele_absent(self, by, selector, timeout=5) -> bool:
+        """Return True if the element is not visible once the page has settled."""
+        return not self.ele_settled(by, selector, timeout)
+
+    def assert_absent(self, by, selector, timeout=5):
+        """Raise AssertionError, after capturing a failure bundle, if the element shows once settled."""
+        el = self.ele_settled(by, selector, timeout)
+        if el:
+            self._screenshot(selector)
+            raise AssertionError(
+                f"Expected no visible element with locator: ({by}, {selector}), found {el.text!r}"
+            )
 
     def ele_exists(self, selector):
-        """Return the element if it exists in the DOM, otherwise False."""
+        """Return the element if it exists in the DOM, otherwise False.
+
+        Found elements are cached per locator (see ``ElementCache``); a cached
+        one that is still current costs one probe instead of a lookup.
+        """
+        cache = element_cache(self.driver)
+        cached = cache.lookup(self.driver, selector)
+        if cached:
+            return cached[0]
         try:
-            return self.driver.find_element(*selector)
+            el = self.driver.find_element(*selector)
 
         except NoSuchElementException:
             return False
+        cache.store(selector, el)
+        return el
 
     def elements_exists(self, selector):
         """Return a list of elements, or an empty list if none found."""
@@ -94,10 +389,46 @@ class BasePage:
 
     def dropdowns(self, selector):
         """Return a Select object for the given dropdown locator."""
+        return self._operate(
+            "dropdowns", tuple(selector), wait_visible, Select,
+            f"Dropdown not found: {selector}",
+            reuse="visible",
+        )
+
+    def select_option(self, locator, text: str, timeout=10) -> bool:
+        """Select a <select> option by its visible text in one script call.
+
+        The text -> value map is cached per page load, so repeat selections send
+        only the value. Returns False if no option has that text; raises
+        TimeoutException if the dropdown never appears.
+        """
+        token, options = self._dropdown_options.get(locator, (None, {}))
         try:
-            el = wait_visible(self.driver, selector)
-            return Select(el)
+            new_token, fresh, selected = wait_until(
+                self.driver,
+                lambda d: d.execute_script(
+                    self._SELECT_SCRIPT, *locator, token, options.get(text), text,
+                ),
+                timeout,
+                label=f"dropdown {locator}",
+            )
+        except TimeoutException:
+            self._screenshot(locator[1])
+            raise TimeoutException(f"Dropdown not found: {locator}")
 
+        if fresh is not None:
+            self._dropdown_options[locator] = (new_token, dict(fresh))
+        return selected
+
+    def selected_option_text(self, locator, timeout=10) -> str:
+        """Return the text of the selected option in one script call ('' if none)."""
+        def read(driver):
+            text = driver.execute_script(self._SELECTED_TEXT_SCRIPT, *locator)
+            return (text,) if text is not None else False
+
+        try:
+            (text,) = wait_until(self.driver, read, timeout, label=f"dropdown {locator}")
+            return text
         except TimeoutException:
-            self._screenshot(selector[1])
-            raise TimeoutException(f"Dropdown not found: {selector}")
\ No newline at end of file
+            self._screenshot(locator[1])
+            raise TimeoutException(f"Dropdown not found: {locator}")
\ No newline at end of file
@@ -1,15 +1,18 @@
-import re
+from decimal import Decimal
+
 from selenium.webdriver.common.by import By
-from src.config import CART_URL
+from src.config import BASE_URL
 from src.pages.base_page import BasePage
+from src.utils.waits import wait_until
 
 
 class CartPage(BasePage):
 
-    CART_URL = CART_URL
+    CART_PATH = "/cart.html"
 
     # Locators
     CART_PAGE_TITLE     = (By.XPATH, "//span[@class='title']")
+    CART_LIST           = (By.CLASS_NAME, "cart_list")
     CONTINUE_SHOPPING_BTN = (By.ID, "continue-shopping")
     CHECKOUT_BTN        = (By.ID, "checkout")
     QTY_LABEL           = (By.CLASS_NAME, "cart_quantity_label")
@@ -20,8 +23,15 @@ class CartPage(BasePage):
     REMOVE_BUTTON       = (By.CSS_SELECTOR, ".btn.btn_secondary.btn_small.cart_button")
     CART_BADGE          = (By.CLASS_NAME, "shopping_cart_badge")
 
+    # SauceDemo persists the cart as a JSON list of product ids under this key
+    CART_STORAGE_KEY    = "cart-contents"
+
+    def __init__(self, driver, base_url=BASE_URL):
+        super().__init__(driver, base_url)
+        self.cart_url = f"{self.base_url}{self.CART_PATH}"
+
     def go_to_cart(self):
-        self.navigate_url(self.CART_URL)
+        self.navigate_url(self.cart_url, ready=self.CHECKOUT_BTN)
 
     def cart_page_title(self) -> str:
         el = self.ele_exists(self.CART_PAGE_TITLE)
@@ -64,6 +74,10 @@ class CartPage(BasePage):
     def get_cart_item_prices_float(self) -> list[float]:
         return [float(p.replace("$", "")) for p in self.get_cart_item_prices()]
 
+    def get_cart_item_prices_decimal(self) -> list[Decimal]:
+        """Return exact item prices, e.g. [Decimal('9.99'), Decimal('15.99')]."""
+        return [Decimal(p.replace("$", "")) for p in self.get_cart_item_prices()]
+
     def get_cart_item_count(self) -> int:
         return len(self.cart_items())
 
@@ -79,17 +93,80 @@ class CartPage(BasePage):
             True  — item found and removed.
             False — item not found in cart.
         """
-        pattern = re.compile(re.escape(item_name), re.IGNORECASE)
+        item = self.find_indexed_item(self.CART_ITEMS[1], self.ITEM_NAME[1], item_name)
+        if item is None:
+            return False
 
-        for item in self.cart_items():
-            name_element = item.find_element(*self.ITEM_NAME)
-            if pattern.search(name_element.text):
-                item.find_element(*self.REMOVE_BUTTON).click()
-                return True
+        item.find_element(*self.REMOVE_BUTTON).click()
+        return True
 
-        return False
+    def remove_items(self, item_names) -> dict[str, bool]:
+        """Remove several items in one browser round-trip; returns {name: removed}."""
+        return self.click_item_buttons(
+            self.CART_ITEMS[1], self.ITEM_NAME[1], self.REMOVE_BUTTON[1], item_names
+        )
 
-    def clear_cart(self):
-        """Remove all items currently in the cart."""
-        for item in self.cart_items():
-            item.find_element(*self.REMOVE_BUTTON).click()
\ No newline at end of file
+    def set_cart_contents(self, product_ids) -> list[int]:
+        """Write product ids straight into the app's cart storage and return them as stored.
+
+        The change is picked up on the next navigation or refresh, e.g. ``go_to_cart()``.
+        Use the UI add/remove flows only where they are the behaviour under test.
+        """
+        return self.driver.execute_script(
+            """
+            const [key, ids] = arguments;
+            if (ids.length) {
+                localStorage.setItem(key, JSON.stringify(ids));
+            } else {
+                localStorage.removeItem(key);
+            }
+            return JSON.parse(localStorage.getItem(key) || '[]');
+            """,
+            self.CART_STORAGE_KEY,
+            [int(product_id) for product_id in product_ids],
+        )
+
+    def get_cart_contents(self) -> list[int]:
+        """Return the product ids currently stored in the app's cart storage."""
+        return self.driver.execute_script(
+            "return JSON.parse(localStorage.getItem(arguments[0]) || '[]');",
+            self.CART_STORAGE_KEY,
+        )
+
+    def clear_cart_contents(self):
+        """Empty the cart via storage, without visiting the cart page."""
+        self.set_cart_contents([])
+
+    # True off the cart page, or once no cart row and no badge remain; otherwise clicks
+    # every Remove button still attached and returns false, so the next poll catches
+    # re-rendered rows
+    _CLEAR_CART_SCRIPT = """
+        const [listClass, buttonSelector, itemClass, badgeClass] = arguments;
+        if (!document.getElementsByClassName(listClass).length) return true;
+        if (!document.getElementsByClassName(itemClass).length
+                && !document.getElementsByClassName(badgeClass).length) {
+            return true;
+        }
+        document.querySelectorAll(buttonSelector).forEach(button => {
+            if (button.isConnected) button.click();
+        });
+        return false;
+    """
+
+    def clear_cart(self, timeout: float = 5) -> bool:
+        """Remove all items shown on the cart page and wait until it shows empty.
+
+        Each poll is one script call that clicks the Remove buttons still on
+        the page, so rows that re-render are picked up by the next poll.
+        Returns True once no cart row and no badge remain, or straight away
+        when the cart page is not open (use ``clear_cart_contents`` there);
+        raises TimeoutException otherwise.
+        """
+        return wait_until(
+            self.driver,
+            lambda d: d.execute_script(
+                self._CLEAR_CART_SCRIPT, self.CART_LIST[1], self.REMOVE_BUTTON[1], self.CART_ITEMS[1], self.CART_BADGE[1]
+            ),
+            timeout,
+            label="cart emptied",
+        )
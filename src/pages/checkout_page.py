@@ -1,15 +1,69 @@
+import re
+from decimal import Decimal
+from typing import NamedTuple
+
 from selenium.webdriver.common.by import By
 
 from src.config import BASE_URL
 from src.pages.base_page import BasePage
+from src.utils.waits import wait_until
+
+# A dollar amount not followed by more digits or separators, so "$1.2.3" is rejected
+_MONEY = re.compile(r"\$\s*([0-9][0-9,]*(?:\.[0-9]+)?)(?![0-9.,])")
+
+
+def _money(text: str) -> Decimal:
+    """Parse the dollar amount in a label such as "Item total: $29.99"."""
+    match = _MONEY.search(text)
+    if match is None:
+        raise ValueError(f"No dollar amount in: {text!r}")
+    return Decimal(match.group(1).replace(",", ""))
+
+
+class OverviewLine(NamedTuple):
+    """One item row on the checkout overview."""
+
+    name: str
+    price: Decimal
+    quantity: int
+
+
+class Overview(NamedTuple):
+    """Everything the checkout overview shows, with exact Decimal amounts."""
+
+    items: tuple[OverviewLine, ...]
+    subtotal: Decimal
+    tax: Decimal
+    total: Decimal
+
+    @property
+    def item_sum(self) -> Decimal:
+        return sum((line.price * line.quantity for line in self.items), Decimal(0))
+
+    @property
+    def problems(self) -> list[str]:
+        """Describe each broken invariant: item sum == subtotal, subtotal + tax == total."""
+        found = []
+        if self.item_sum != self.subtotal:
+            found.append(f"items sum to ${self.item_sum}, subtotal shows ${self.subtotal}")
+        if self.subtotal + self.tax != self.total:
+            found.append(
+                f"subtotal ${self.subtotal} + tax ${self.tax} = ${self.subtotal + self.tax}, "
+                f"total shows ${self.total}"
+            )
+        return found
+
+    @property
+    def consistent(self) -> bool:
+        return not self.problems
 
 
 class CheckoutPage(BasePage):
     """Page object covering Step One, Overview, and Confirmation of SauceDemo checkout."""
 
-    CHECKOUT_STEP1_URL    = f"{BASE_URL}/checkout-step-one.html"
-    CHECKOUT_STEP2_URL    = f"{BASE_URL}/checkout-step-two.html"
-    CHECKOUT_COMPLETE_URL = f"{BASE_URL}/checkout-complete.html"
+    CHECKOUT_STEP1_PATH    = "/checkout-step-one.html"
+    CHECKOUT_STEP2_PATH    = "/checkout-step-two.html"
+    CHECKOUT_COMPLETE_PATH = "/checkout-complete.html"
 
     # --- Step One locators ---
     FIRST_NAME_INPUT  = (By.ID, "first-name")
@@ -35,6 +89,30 @@ class CheckoutPage(BasePage):
     BACK_HOME_BTN     = (By.ID, "back-to-products")
 
 
+    # Reads every overview row and summary label at once; null until the total has rendered
+    _OVERVIEW_SCRIPT = """
+        const text = (root, cls) => {
+            const el = root.getElementsByClassName(cls)[0];
+            return el ? el.innerText.trim() : null;
+        };
+        const summary = ['summary_subtotal_label', 'summary_tax_label', 'summary_total_label']
+            .map(cls => text(document, cls));
+        if (summary.includes(null)) return null;
+        const rows = Array.from(document.getElementsByClassName('cart_item'), row => [
+            text(row, 'inventory_item_name'),
+            text(row, 'inventory_item_price'),
+            text(row, 'cart_quantity'),
+        ]);
+        return [rows, summary];
+    """
+
+    def __init__(self, driver, base_url=BASE_URL):
+        super().__init__(driver, base_url)
+        self.checkout_step1_url    = f"{self.base_url}{self.CHECKOUT_STEP1_PATH}"
+        self.checkout_step2_url    = f"{self.base_url}{self.CHECKOUT_STEP2_PATH}"
+        self.checkout_complete_url = f"{self.base_url}{self.CHECKOUT_COMPLETE_PATH}"
+
+
     def is_on_step_one(self) -> bool:
         return "checkout-step-one" in self.driver.current_url
 
@@ -51,7 +129,7 @@ class CheckoutPage(BasePage):
         self.click(*self.CANCEL_BTN)
 
     def get_error_message(self) -> str:
-        el = self.ele_visible(*self.ERROR_MESSAGE)
+        el = self.ele_settled(*self.ERROR_MESSAGE)
         return el.text if el else ""
 
 
@@ -67,18 +145,34 @@ class CheckoutPage(BasePage):
         return [item.find_element(*self.ITEM_NAME).text for item in items]
 
     def get_subtotal(self) -> float:
-        """Return subtotal as a float by stripping the label prefix."""
-        text = self.ele_text(*self.SUBTOTAL_LABEL)
+        """Return the subtotal as a float. Legacy; prefer ``read_overview().subtotal``."""
         # text is like "Item total: $29.99"
-        return float(text.split("$")[-1])
+        return float(_money(self.ele_text(*self.SUBTOTAL_LABEL)))
 
     def get_tax(self) -> float:
-        text = self.ele_text(*self.TAX_LABEL)
-        return float(text.split("$")[-1])
+        """Return the tax as a float. Legacy; prefer ``read_overview().tax``."""
+        return float(_money(self.ele_text(*self.TAX_LABEL)))
 
     def get_total(self) -> float:
-        text = self.ele_text(*self.TOTAL_LABEL)
-        return float(text.split("$")[-1])
+        """Return the total as a float. Legacy; prefer ``read_overview().total``."""
+        return float(_money(self.ele_text(*self.TOTAL_LABEL)))
+
+    def read_overview(self, timeout: float = 5) -> Overview:
+        """Return the overview's items, subtotal, tax and total from one script call.
+
+        Amounts are parsed as Decimal so sums compare exactly; see
+        ``Overview.problems`` for the built-in consistency check.
+        """
+        rows, (subtotal, tax, total) = wait_until(
+            self.driver,
+            lambda d: d.execute_script(self._OVERVIEW_SCRIPT),
+            timeout,
+            label="checkout overview rendered",
+        )
+        items = tuple(
+            OverviewLine(name, _money(price), int(quantity or 1)) for name, price, quantity in rows
+        )
+        return Overview(items, _money(subtotal), _money(tax), _money(total))
 
     def click_finish(self):
         self.click(*self.FINISH_BTN)
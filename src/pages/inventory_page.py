@@ -1,15 +1,49 @@
 import re
-from typing import Literal
-from selenium.common.exceptions import NoSuchElementException
+from collections.abc import Iterator
+from typing import ClassVar, Literal, NamedTuple
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from src.config import INVENTORY_URL
+from src.config import BASE_URL
 from src.pages.base_page import BasePage
+from src.utils.waits import FIND_JS, ensure_script_timeout, wait_until
+
+
+class InventoryItem(NamedTuple):
+    """Immutable snapshot of a single inventory tile."""
+
+    name: str
+    price: str
+    image_src: str
+    button_text: str
+    name_visible: bool
+    price_visible: bool
+    image_visible: bool
+    product_id: int | None = None
+
+
+class ToggleResult(NamedTuple):
+    """Outcome of the Add to cart -> Remove -> Add to cart cycle for one tile."""
+
+    name: str
+    ok: bool
+    labels: tuple[str, ...]     # button text initially, after add, after remove
+    add_ms: float | None        # click -> "Remove" rendered
+    remove_ms: float | None     # click -> "Add to cart" rendered
+    error: str
+
+
+class SortCheck(NamedTuple):
+    """Result of checking the rendered tile order against one filter."""
+
+    key: str
+    ok: bool
+    values: tuple               # names (str) or prices (float), in display order
+    violation: tuple | None     # (index, previous value, value) of the first out-of-order tile
 
 
 class InventoryPage(BasePage):
 
-    INVENTORY_URL = INVENTORY_URL
+    INVENTORY_PATH = "/inventory.html"
 
     # Locators
     PAGE_TITLE      = (By.CLASS_NAME, "app_logo")
@@ -26,17 +60,152 @@ class InventoryPage(BasePage):
     INVENTORY_NAMES   = (By.CLASS_NAME, "inventory_item_name")
     INVENTORY_PRICE   = (By.CLASS_NAME, "inventory_item_price")
     INVENTORY_ADDTOCART = (By.XPATH, ".//button[contains(@id,'add-to-cart') or contains(@id,'remove')]")
+    TILE_BUTTON_CSS     = "button[id*='add-to-cart'], button[id*='remove']"
+
+    # Every tile's title link carries the product id used in PDP URLs and cart storage
+    TITLE_LINK_ID       = "item_{}_title_link"
+
+    # Reads tiles [offset, offset + limit) in a single round-trip (limit null = all) and
+    # the total rendered; selectors mirror the child locators above
+    _SNAPSHOT_SCRIPT = FIND_JS + """
+        const [offset, limit] = arguments;
+        const shown = el => !!el && visible(el);
+        const text = el => el ? el.innerText.trim() : '';
+        const tiles = document.getElementsByClassName('inventory_item');
+        const end = limit === null ? tiles.length : Math.min(tiles.length, offset + limit);
+        const rows = [];
+        for (let i = offset; i < end; i++) {
+            const item = tiles[i];
+            const name = item.querySelector('.inventory_item_name');
+            const price = item.querySelector('.inventory_item_price');
+            const img = item.querySelector("img[class='inventory_item_img']");
+            const btn = item.querySelector("button[id*='add-to-cart'], button[id*='remove']");
+            const link = item.querySelector("a[id$='_title_link']");
+            const id = link && /^item_(\\d+)_title_link$/.exec(link.id);
+            rows.push({
+                name: text(name),
+                price: text(price),
+                image_src: img ? (img.getAttribute('src') || '') : '',
+                button_text: text(btn),
+                name_visible: shown(name),
+                price_visible: shown(price),
+                image_visible: shown(img),
+                product_id: id ? Number(id[1]) : null,
+            });
+        }
+        return [rows, tiles.length];
+    """
+
+    # Clicks "Add to cart" on the tiles owning the given title link ids; one call for all
+    _ADD_BY_ID_SCRIPT = """
+        const [linkIds, buttonSelector] = arguments;
+        return linkIds.map(linkId => {
+            const link = document.getElementById(linkId);
+            const item = link && link.closest('.inventory_item');
+            const button = item && item.querySelector(buttonSelector);
+            if (!button || button.innerText.trim() !== 'Add to cart') return false;
+            button.click();
+            return true;
+        });
+    """
+
+    # Scrolls the last tile into view so lazy / infinite-scroll lists render their next page
+    _LOAD_MORE_SCRIPT = """
+        const tiles = document.getElementsByClassName('inventory_item');
+        if (tiles.length) tiles[tiles.length - 1].scrollIntoView({block: 'end'});
+        window.scrollTo(0, document.documentElement.scrollHeight);
+    """
+
+    _COUNT_SCRIPT = "return document.getElementsByClassName('inventory_item').length;"
+
+    # Returns null until the sort label shows `label`, then the column values and the
+    # index of the first tile out of order (null when the order holds)
+    _SORT_CHECK_SCRIPT = """
+        const [label, column, descending] = arguments;
+        const active = document.querySelector('.active_option');
+        if (!active || active.innerText.trim() !== label) return null;
+        const cls = column === 'price' ? 'inventory_item_price' : 'inventory_item_name';
+        const values = Array.from(document.getElementsByClassName(cls), el => {
+            const text = el.innerText.trim();
+            return column === 'price' ? parseFloat(text.replace('$', '')) : text;
+        });
+        const inOrder = (a, b) => descending ? a >= b : a <= b;
+        const bad = values.findIndex((value, i) => i > 0 && !inOrder(values[i - 1], value));
+        return [values, bad === -1 ? null : bad];
+    """
+
+    # Toggles every tile in turn and awaits each label change with a MutationObserver,
+    # so a sweep costs one round-trip however many products there are
+    _TOGGLE_SWEEP_SCRIPT = """
+        const [buttonSelector, labelTimeoutMs, budgetMs, done] = arguments;
+        const deadline = performance.now() + budgetMs;
+        const text = el => el ? el.innerText.trim() : '';
+        const label = item => text(item.querySelector(buttonSelector));
+
+        const waitForLabel = (item, expected) => new Promise(resolve => {
+            if (label(item) === expected) return resolve(true);
+            const finish = ok => { observer.disconnect(); clearTimeout(timer); resolve(ok); };
+            const observer = new MutationObserver(() => { if (label(item) === expected) finish(true); });
+            observer.observe(item, {subtree: true, childList: true, characterData: true, attributes: true});
+            const wait = Math.max(0, Math.min(labelTimeoutMs, deadline - performance.now()));
+            const timer = setTimeout(() => finish(label(item) === expected), wait);
+        });
+
+        const step = async (item, entry, expected, key) => {
+            const start = performance.now();
+            item.querySelector(buttonSelector).click();
+            const ok = await waitForLabel(item, expected);
+            entry[key] = performance.now() - start;
+            entry.labels.push(label(item));
+            if (!ok) entry.error = `expected '${expected}', got '${label(item)}'`;
+            return ok;
+        };
+
+        (async () => {
+            const report = [];
+            for (const item of Array.from(document.getElementsByClassName('inventory_item'))) {
+                const entry = {
+                    name: text(item.querySelector('.inventory_item_name')),
+                    ok: false, labels: [label(item)], add_ms: null, remove_ms: null, error: '',
+                };
+                report.push(entry);
+                if (performance.now() > deadline) {
+                    entry.error = 'sweep time budget exhausted';
+                } else if (entry.labels[0] !== 'Add to cart') {
+                    entry.error = `initial label '${entry.labels[0]}'`;
+                } else if (await step(item, entry, 'Remove', 'add_ms')) {
+                    entry.ok = await step(item, entry, 'Add to cart', 'remove_ms');
+                }
+            }
+            return report;
+        })().then(done, error => done([{name: '', ok: false, labels: [], add_ms: null,
+                                         remove_ms: null, error: String(error)}]));
+    """
+
+    PRICE_PATTERN = re.compile(r"^\$\d+\.\d{2}$")
 
     # Filter map shared across the class
-    FILTER_MAP = {
+    FILTER_MAP: ClassVar[dict[str, str]] = {
         "a_z": "Name (A to Z)",
         "z_a": "Name (Z to A)",
         "l_h": "Price (low to high)",
         "h_l": "Price (high to low)",
     }
 
+    # Filter key -> (column it orders, descending)
+    SORT_COLUMNS: ClassVar[dict[str, tuple[str, bool]]] = {
+        "a_z": ("name", False),
+        "z_a": ("name", True),
+        "l_h": ("price", False),
+        "h_l": ("price", True),
+    }
+
+    def __init__(self, driver, base_url=BASE_URL):
+        super().__init__(driver, base_url)
+        self.inventory_url = f"{self.base_url}{self.INVENTORY_PATH}"
+
     def open(self):
-        self.navigate_url(self.INVENTORY_URL)
+        self.navigate_url(self.inventory_url, ready=self.INVENTORY_ITEMS)
         return self
 
     def get_page_logo_text(self) -> str:
@@ -58,7 +227,7 @@ class InventoryPage(BasePage):
         return self.elements_exists(self.INVENTORY_ITEMS)
 
     def get_inventory_count(self) -> int:
-        return len(self.elements_exists(self.INVENTORY_ITEMS))
+        return self.driver.execute_script(self._COUNT_SCRIPT)
 
     def apply_filter(self, short_filter: Literal["a_z", "z_a", "l_h", "h_l"] = "a_z"):
         """Select a sort filter by shorthand key.
@@ -69,92 +238,161 @@ class InventoryPage(BasePage):
             l_h -> Price (low to high)
             h_l -> Price (high to low)
         """
-        target_text = self.FILTER_MAP.get(short_filter.lower())
-        if not target_text:
+        target_text = self.FILTER_MAP[self._filter_key(short_filter)]
+        if not self.select_option(self.FILTER_DROPDOWN, target_text):
+            raise NoSuchElementException(f"Filter option not found: '{target_text}'")
+
+    def _filter_key(self, short_filter: str) -> str:
+        """Return the ``FILTER_MAP`` key for ``short_filter`` (any case); raise ValueError if unknown."""
+        key = short_filter.lower()
+        if key not in self.FILTER_MAP:
             raise ValueError(
                 f"Invalid filter key: '{short_filter}'. Valid keys: {list(self.FILTER_MAP.keys())}"
             )
-        dropdown = self.dropdowns(self.FILTER_DROPDOWN)
-        dropdown.select_by_visible_text(target_text)
+        return key
 
     def current_filter(self) -> str:
         """Return the currently selected filter label."""
-        dropdown = self.dropdowns(self.FILTER_DROPDOWN)
-        return dropdown.first_selected_option.text
+        return self.selected_option_text(self.FILTER_DROPDOWN)
+
+    def verify_sort(self, short_filter: Literal["a_z", "z_a", "l_h", "h_l"], timeout: float = 5) -> SortCheck:
+        """Apply a filter and check the rendered order inside the browser.
+
+        Waits until the sort label reflects the filter, then reads the keyed column
+        and checks it is monotonic in one script call. Ties are allowed.
+        """
+        short_filter = self._filter_key(short_filter)
+        column, descending = self.SORT_COLUMNS[short_filter]
+        self.apply_filter(short_filter)
+        values, bad = wait_until(
+            self.driver,
+            lambda d: d.execute_script(
+                self._SORT_CHECK_SCRIPT, self.FILTER_MAP[short_filter], column, descending
+            ),
+            timeout,
+            label=f"sort '{short_filter}' rendered",
+        )
+        violation = None if bad is None else (bad, values[bad - 1], values[bad])
+        return SortCheck(short_filter, bool(values) and violation is None, tuple(values), violation)
+
+    def verify_all_sorts(self) -> dict[str, SortCheck]:
+        """Check every ``FILTER_MAP`` order on the current page, then restore the original filter."""
+        current = self.current_filter()
+        original = next((key for key, label in self.FILTER_MAP.items() if label == current), "a_z")
+        checks = {key: self.verify_sort(key) for key in self.FILTER_MAP}
+        self.apply_filter(original)
+        return checks
 
     def get_cart_badge_count(self) -> int:
         """Return cart badge number, or 0 if badge is absent."""
         el = self.ele_exists(self.CART_BADGE)
         return int(el.text.strip()) if el else 0
 
-    def all_products_have_images(self) -> bool:
-        """Validate that each inventory item has a visible image with a src attribute."""
-        items = self.elements_exists(self.INVENTORY_ITEMS)
-        if not items:
+    def get_inventory_snapshot(self) -> tuple[InventoryItem, ...]:
+        """Return name, price, image, button label and visibility for every tile in one call."""
+        rows, _total = self.driver.execute_script(self._SNAPSHOT_SCRIPT, 0, None)
+        return tuple(InventoryItem(**row) for row in rows)
+
+    def iter_inventory(
+        self, chunk_size: int = 50, load_more: bool = False, load_timeout: float = 2
+    ) -> Iterator[InventoryItem]:
+        """Yield every tile, fetching ``chunk_size`` tiles per round-trip.
+
+        Only the current chunk is held in memory, so a consumer that stops early
+        (e.g. ``next(...)`` for the first match) never reads the rest of the catalog.
+        With ``load_more``, reaching the last rendered tile scrolls it into view so a
+        lazily loaded list appends its next page; iteration ends once no new tiles
+        appear within ``load_timeout`` seconds.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk size: {chunk_size}. Must be at least 1")
+
+        offset = 0
+        while True:
+            rows, total = self.driver.execute_script(self._SNAPSHOT_SCRIPT, offset, chunk_size)
+            for row in rows:
+                yield InventoryItem(**row)
+            offset += len(rows)
+            if offset < total:
+                continue
+            if not load_more or not self._load_more_tiles(total, load_timeout):
+                return
+
+    def _load_more_tiles(self, rendered: int, timeout: float) -> bool:
+        """Scroll to the end of the list; return True if more than ``rendered`` tiles appear."""
+        self.driver.execute_script(self._LOAD_MORE_SCRIPT)
+        try:
+            wait_until(
+                self.driver,
+                lambda d: d.execute_script(self._COUNT_SCRIPT) > rendered,
+                timeout,
+                label="more inventory tiles",
+            )
+            return True
+        except TimeoutException:
             return False
 
-        for item in items:
-            image = WebDriverWait(item, 5, ignored_exceptions=[NoSuchElementException]).until(
-                lambda i: i.find_element(*self.INVENTORY_IMGS).is_displayed()
-                and i.find_element(*self.INVENTORY_IMGS)
+    def all_products_have_images(self) -> bool:
+        """Validate that each inventory item has a visible image with a src attribute."""
+        def images_ready(_driver):
+            snapshot = self.get_inventory_snapshot()
+            return bool(snapshot) and all(
+                item.image_visible and item.image_src for item in snapshot
             )
-            if not image.is_displayed() or not image.get_attribute("src"):
-                return False
 
-        return True
+        try:
+            return wait_until(self.driver, images_ready, 5, label="inventory images")
+
+        except TimeoutException:
+            return False
 
     def all_products_have_names(self) -> bool:
         """Validate that each inventory item has a visible, non-empty name."""
-        items = self.elements_exists(self.INVENTORY_ITEMS)
-        if not items:
+        snapshot = self.get_inventory_snapshot()
+        if not snapshot:
             return False
 
-        for item in items:
-            name = item.find_element(*self.INVENTORY_NAMES)
-            if not name.is_displayed() or not name.text.strip():
-                return False
-
-        return True
+        return all(item.name_visible and item.name for item in snapshot)
 
     def all_products_have_prices(self) -> bool:
         """Validate that each inventory item has a visible price matching $X.XX format."""
-        items = self.elements_exists(self.INVENTORY_ITEMS)
-        if not items:
+        snapshot = self.get_inventory_snapshot()
+        if not snapshot:
             return False
 
-        price_pattern = re.compile(r"^\$\d+\.\d{2}$")
+        return all(
+            item.price_visible and self.PRICE_PATTERN.match(item.price)
+            for item in snapshot
+        )
 
-        for item in items:
-            price = item.find_element(*self.INVENTORY_PRICE)
-            if not price.is_displayed() or not price.text.strip():
-                return False
-            if not price_pattern.match(price.text.strip()):
-                return False
+    def toggle_sweep(self, label_timeout: float = 2, budget: float = 25) -> tuple[ToggleResult, ...]:
+        """Run Add to cart -> Remove -> Add to cart on every tile inside the browser.
 
-        return True
+        Each click waits up to ``label_timeout`` s for the new label to render; the
+        whole sweep stops starting new tiles after ``budget`` s. Tiles are left as
+        found when they pass.
+        """
+        ensure_script_timeout(self.driver, budget + label_timeout * 2 + 1)
+        report = self.driver.execute_async_script(
+            self._TOGGLE_SWEEP_SCRIPT, self.TILE_BUTTON_CSS,
+            int(label_timeout * 1000), int(budget * 1000),
+        )
+        return tuple(
+            ToggleResult(
+                entry["name"], entry["ok"], tuple(entry["labels"]),
+                entry["add_ms"], entry["remove_ms"], entry["error"],
+            )
+            for entry in report
+        )
 
     def add_to_cart_button_toggle_works(self) -> bool:
         """Validate Add to Cart ↔ Remove button toggle for every inventory item."""
-        items = self.elements_exists(self.INVENTORY_ITEMS)
-        if not items:
-            return False
-
-        for item in items:
-            button = item.find_element(*self.INVENTORY_ADDTOCART)
-            if button.text.strip() != "Add to cart":
-                return False
+        report = self.toggle_sweep()
+        return bool(report) and all(result.ok for result in report)
 
-            button.click()
-            remove_button = item.find_element(*self.INVENTORY_ADDTOCART)
-            if remove_button.text.strip() != "Remove":
-                return False
-
-            remove_button.click()
-            add_button = item.find_element(*self.INVENTORY_ADDTOCART)
-            if add_button.text.strip() != "Add to cart":
-                return False
-
-        return True
+    def _find_item(self, item_name: str):
+        """Return the inventory tile for a product name via the cached name index."""
+        return self.find_indexed_item(self.INVENTORY_ITEMS[1], self.INVENTORY_NAMES[1], item_name)
 
     def add_item_to_cart(self, item_name: str) -> bool:
         """Find an item by name (case-insensitive) and add it to the cart.
@@ -163,80 +401,91 @@ class InventoryPage(BasePage):
             True  — item found and added.
             False — item already in cart or not found.
         """
-        items = self.get_inventory_items()
-        pattern = re.compile(re.escape(item_name), re.IGNORECASE)
+        item = self._find_item(item_name)
+        if item is None:
+            return False
 
-        for item in items:
-            name_element = item.find_element(*self.INVENTORY_NAMES)
-            if pattern.search(name_element.text):
-                add_button = item.find_element(*self.INVENTORY_ADDTOCART)
-                if add_button.text.strip() != "Add to cart":
-                    return False
-                add_button.click()
-                return True
+        add_button = item.find_element(*self.INVENTORY_ADDTOCART)
+        if add_button.text.strip() != "Add to cart":
+            return False
+        add_button.click()
+        return True
 
-        return False
+    def add_items_to_cart(self, item_names) -> dict[str, bool]:
+        """Add several items in one browser round-trip.
 
-    def get_item_button_text(self, item_name: str) -> str:
-        """Return the Add/Remove button text for a specific item by name."""
-        items = self.get_inventory_items()
-        pattern = re.compile(re.escape(item_name), re.IGNORECASE)
+        Returns {name: added}; False means not found or already in the cart,
+        matching ``add_item_to_cart``.
+        """
+        return self.click_item_buttons(
+            self.INVENTORY_ITEMS[1], self.INVENTORY_NAMES[1], self.TILE_BUTTON_CSS,
+            item_names, label="Add to cart",
+        )
 
-        for item in items:
-            name_element = item.find_element(*self.INVENTORY_NAMES)
-            if pattern.search(name_element.text):
-                btn = item.find_element(*self.INVENTORY_ADDTOCART)
-                return btn.text.strip()
+    def find_item_by_id(self, product_id: int):
+        """Return the inventory tile for a product id via its title link, or None.
 
-        return ""
+        A direct id lookup: cost does not grow with the catalog size.
+        """
+        return self.driver.execute_script(
+            "const link = document.getElementById(arguments[0]);"
+            "return link ? link.closest('.inventory_item') : null;",
+            self.TITLE_LINK_ID.format(int(product_id)),
+        )
+
+    def add_items_to_cart_by_id(self, product_ids) -> dict[int, bool]:
+        """Add products by id in one round-trip; returns {product_id: added}.
+
+        False means no tile for that id is rendered or it is already in the cart.
+        """
+        product_ids = [int(product_id) for product_id in product_ids]
+        added = self.driver.execute_script(
+            self._ADD_BY_ID_SCRIPT,
+            [self.TITLE_LINK_ID.format(product_id) for product_id in product_ids],
+            self.TILE_BUTTON_CSS,
+        )
+        return dict(zip(product_ids, added))
+
+    def add_item_to_cart_by_id(self, product_id: int) -> bool:
+        """Add a single product by id; see ``add_items_to_cart_by_id``."""
+        return self.add_items_to_cart_by_id([product_id])[int(product_id)]
+
+    def get_item_button_text(self, item_name: str) -> str:
+        """Return the Add/Remove button text for a specific item by name."""
+        item = self._find_item(item_name)
+        if item is None:
+            return ""
+        return item.find_element(*self.INVENTORY_ADDTOCART).text.strip()
 
     def click_item_name(self, item_name: str) -> bool:
         """Click a product name link to navigate to its PDP.
 
         Returns True if the item was found and clicked, False otherwise.
         """
-        items = self.get_inventory_items()
-        pattern = re.compile(re.escape(item_name), re.IGNORECASE)
-
-        for item in items:
-            name_element = item.find_element(*self.INVENTORY_NAMES)
-            if pattern.search(name_element.text):
-                name_element.click()
-                return True
-
-        return False
+        item = self._find_item(item_name)
+        if item is None:
+            return False
+        item.find_element(*self.INVENTORY_NAMES).click()
+        return True
 
     def get_item_price(self, item_name: str) -> str:
         """Return the raw price string (e.g. '$9.99') for a named item."""
-        items = self.get_inventory_items()
-        pattern = re.compile(re.escape(item_name), re.IGNORECASE)
-
-        for item in items:
-            name_element = item.find_element(*self.INVENTORY_NAMES)
-            if pattern.search(name_element.text):
-                return item.find_element(*self.INVENTORY_PRICE).text.strip()
-
-        return ""
+        item = self._find_item(item_name)
+        if item is None:
+            return ""
+        return item.find_element(*self.INVENTORY_PRICE).text.strip()
 
     def get_product_names(self) -> list[str]:
         """Return a list of all displayed product names."""
-        items = self.elements_exists(self.INVENTORY_ITEMS)
-        return [item.find_element(*self.INVENTORY_NAMES).text for item in items]
+        return [item.name for item in self.get_inventory_snapshot()]
 
     def get_product_prices(self) -> list[float]:
         """Return a list of all displayed product prices as floats."""
-        items = self.elements_exists(self.INVENTORY_ITEMS)
-        return [
-            float(item.find_element(*self.INVENTORY_PRICE).text.replace("$", ""))
-            for item in items
-        ]
+        return [float(item.price.replace("$", "")) for item in self.get_inventory_snapshot()]
 
     def all_buttons_say_add_to_cart(self) -> bool:
         """Return True if every inventory item button reads 'Add to cart'."""
-        items = self.get_inventory_items()
-        if not items:
+        snapshot = self.get_inventory_snapshot()
+        if not snapshot:
             return False
-        return all(
-            item.find_element(*self.INVENTORY_ADDTOCART).text.strip() == "Add to cart"
-            for item in items
-        )
\ No newline at end of file
+        return all(item.button_text == "Add to cart" for item in snapshot)
@@ -1,23 +1,45 @@
+from selenium.common.exceptions import InvalidCookieDomainException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from src.config import BASE_URL, STANDARD_USER, STANDARD_PASSWORD
 from src.pages.base_page import BasePage
+from src.pages.cart_page import CartPage
 from src.pages.inventory_page import InventoryPage
-from src.utils.waits import wait_clickable
+from src.utils.waits import Condition, wait_any, wait_clickable, wait_visible
 
 
 class LoginPage(BasePage):
 
-    LOGIN_URL = BASE_URL
-
     # Locators
     USERNAME_BOX = (By.ID, "user-name")
     PASSWORD_BOX = (By.ID, "password")
     LOGIN_BTN = (By.ID, "login-button")
     ERROR_MESSAGE = (By.XPATH, "//h3[@data-test='error']")
 
+    # SauceDemo keeps the logged-in user in this cookie; setting it is a full login
+    SESSION_COOKIE = "session-username"
+
+    # True when the page looks exactly as login_with_session leaves it: the user's
+    # cookie, inventory page, empty cart storage, no badge, default sort, menu closed
+    _FRESH_SESSION_SCRIPT = """
+        const [cookieName, username, inventoryPath, cartKey, defaultSort] = arguments;
+        const cookie = document.cookie.split('; ').find(c => c.startsWith(cookieName + '='));
+        const sort = document.querySelector('.active_option');
+        const menu = document.querySelector('.bm-menu-wrap');
+        return !!cookie
+            && decodeURIComponent(cookie.slice(cookieName.length + 1)) === username
+            && location.pathname.endsWith(inventoryPath)
+            && !localStorage.getItem(cartKey)
+            && !!document.getElementById('react-burger-menu-btn')
+            && !document.querySelector('.shopping_cart_badge')
+            && (!sort || sort.innerText.trim() === defaultSort)
+            && (!menu || menu.getAttribute('aria-hidden') !== 'false');
+    """
+
+    def __init__(self, driver, base_url=BASE_URL):
+        super().__init__(driver, base_url)
+        self.login_url = self.base_url
+
     def is_logged_in(self) -> bool:
         return bool(self.ele_exists(InventoryPage.NAVIGATION_MENU))
 
@@ -26,27 +48,69 @@ class LoginPage(BasePage):
         if self.is_logged_in():
             return True
 
-        self.navigate_url(self.LOGIN_URL)
+        self.navigate_url(self.login_url)
         self.type(*self.USERNAME_BOX, text=username)
         self.type(*self.PASSWORD_BOX, text=password)
         self.click(*self.LOGIN_BTN)
 
         try:
-            WebDriverWait(self.driver, 5).until(
-                EC.any_of(
-                    EC.visibility_of_element_located(self.ERROR_MESSAGE),
-                    EC.visibility_of_element_located(InventoryPage.NAVIGATION_MENU),
-                )
+            result = wait_any(
+                self.driver,
+                {
+                    "logged_in": Condition.visible(InventoryPage.NAVIGATION_MENU),
+                    "error": Condition.visible(self.ERROR_MESSAGE),
+                },
+                5,
+                label="login result",
             )
-            return self.is_logged_in()
+            return result.first == "logged_in"
 
         except Exception:
             # Neither success nor error appeared within timeout
             return False
 
+    def login_with_session(self, username=STANDARD_USER, target_url=None,
+                           ready=InventoryPage.NAVIGATION_MENU) -> bool:
+        """Log in without the form by setting the session cookie, then open target_url.
+
+        Clears any existing cookies and storage first, so the session starts with an
+        empty cart. Use ``login`` only for tests that exercise the login form itself.
+        ``ready`` marks the target page as rendered under an eager/none page-load
+        strategy; the default (the burger menu) is on every logged-in page.
+        Returns True if the target page rendered for a logged-in user.
+        """
+        cookie = {"name": self.SESSION_COOKIE, "value": username, "path": "/"}
+        self.reset_browser_state()
+        try:
+            self.driver.add_cookie(cookie)
+        except InvalidCookieDomainException:
+            # Browser is off the app origin (e.g. after an external link); land on it
+            # first and clear the app's own storage, which the reset above could not reach
+            self.navigate_url(self.login_url, ready=self.LOGIN_BTN)
+            self.reset_browser_state()
+            self.driver.add_cookie(cookie)
+
+        self.navigate_url(target_url or f"{self.base_url}{InventoryPage.INVENTORY_PATH}", ready=ready)
+        return self.is_logged_in()
+
+    def session_is_fresh(self, username=STANDARD_USER) -> bool:
+        """Return True if the browser is in the state ``login_with_session`` produces.
+
+        One script call; lets a caller skip a redundant login between tests.
+        """
+        return bool(self.driver.execute_script(
+            self._FRESH_SESSION_SCRIPT, self.SESSION_COOKIE, username,
+            InventoryPage.INVENTORY_PATH, CartPage.CART_STORAGE_KEY, InventoryPage.FILTER_MAP["a_z"],
+        ))
+
+    def end_session(self):
+        """Drop the session cookie and storage and return to the login page."""
+        self.reset_browser_state()
+        self.navigate_url(self.login_url, ready=self.LOGIN_BTN)
+
     def get_error_message(self) -> str:
         """Return the visible error message text, or an empty string."""
-        el = self.ele_visible(*self.ERROR_MESSAGE)
+        el = self.ele_settled(*self.ERROR_MESSAGE)
         return el.text if el else ""
 
     def log_out(self) -> bool:
@@ -58,9 +122,7 @@ class LoginPage(BasePage):
             wait_clickable(self.driver, InventoryPage.NAVIGATION_MENU).click()
             wait_clickable(self.driver, InventoryPage.LOGOUT_BTN).click()
 
-            WebDriverWait(self.driver, 5).until(
-                EC.visibility_of_element_located(self.LOGIN_BTN)
-            )
+            wait_visible(self.driver, self.LOGIN_BTN, timeout=5)
             return bool(self.ele_exists(self.LOGIN_BTN))
 
         except Exception as e:
@@ -1,6 +1,6 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from src.pages.base_page import BasePage
+from src.utils.waits import wait_attribute
 
 
 
@@ -27,14 +27,10 @@ class NavPage(BasePage):
         return el.get_attribute("aria-hidden") == "false"
 
     def _wait_menu_open(self, timeout: int = 5):
-        WebDriverWait(self.driver, timeout).until(
-            lambda d: d.find_element(*self.MENU_WRAPPER).get_attribute("aria-hidden") == "false"
-        )
+        wait_attribute(self.driver, self.MENU_WRAPPER, "aria-hidden", "false", timeout)
 
     def _wait_menu_closed(self, timeout: int = 5):
-        WebDriverWait(self.driver, timeout).until(
-            lambda d: d.find_element(*self.MENU_WRAPPER).get_attribute("aria-hidden") == "true"
-        )
+        wait_attribute(self.driver, self.MENU_WRAPPER, "aria-hidden", "true", timeout)
 
 
     def open_menu(self):
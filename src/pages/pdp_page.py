@@ -7,7 +7,7 @@ from src.pages.base_page import BasePage
 class PDPPage(BasePage):
     """Page object for the Product Details Page (/inventory-item.html?id=X)."""
 
-    PDP_BASE_URL = f"{BASE_URL}/inventory-item.html"
+    PDP_PATH = "/inventory-item.html"
 
     # Locators
     BACK_BUTTON    = (By.ID, "back-to-products")
@@ -18,9 +18,13 @@ class PDPPage(BasePage):
     ADD_REMOVE_BTN = (By.XPATH, "//button[contains(@id,'add-to-cart') or contains(@id,'remove')]")
     CART_BADGE     = (By.CLASS_NAME, "shopping_cart_badge")
 
+    def __init__(self, driver, base_url=BASE_URL):
+        super().__init__(driver, base_url)
+        self.pdp_url = f"{self.base_url}{self.PDP_PATH}"
+
     def open(self, product_id: int):
         """Navigate directly to a PDP by product ID."""
-        self.navigate_url(f"{self.PDP_BASE_URL}?id={product_id}")
+        self.navigate_url(f"{self.pdp_url}?id={product_id}", ready=self.BACK_BUTTON)
         return self
 
 
@@ -40,7 +44,7 @@ class PDPPage(BasePage):
     def is_image_displayed(self) -> bool:
         """get_attribute("src") returns a string or None,
         and the return type annotation promises a bool"""
-        el = self.ele_visible(*self.PRODUCT_IMAGE)
+        el = self.ele_settled(*self.PRODUCT_IMAGE)
         if not el:
             return False
         return bool(el.get_attribute("src"))
@@ -0,0 +1,236 @@
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from selenium.common.exceptions import WebDriverException
+
+from src.utils.instrumentation import NO_TEST
+
+logger = logging.getLogger(__name__)
+
+# Parallel runs give every pytest-xdist worker its own folder so files never collide
+ARTIFACTS_DIR = os.path.join("screenshots", os.getenv("PYTEST_XDIST_WORKER", "")).rstrip(os.sep)
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+_DOM_SCRIPT = "return [location.href, document.documentElement.outerHTML];"
+
+
+def _safe_name(text: str, limit: int = 120) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text).strip("_")[:limit] or "artifact"
+
+
+class ArtifactStore:
+    """Failure artifacts (screenshot, DOM, console log) with the disk work off the test thread.
+
+    ``capture`` still makes its WebDriver calls synchronously on the test
+    thread (screenshot, one DOM script, the console log): three or four round
+    trips. Only decoding, hashing, gzip and disk writes run on a small thread
+    pool. Identical screenshots are stored once.
+
+    Each failure gets a bundle directory ``<root>/<test id>/<timestamp>_<label>/``
+    holding ``meta.json`` and ``dom.html.gz``, plus ``screenshot.png`` unless
+    the frame duplicates one already on disk. In that case ``meta.json``
+    points at the existing file.
+
+    Once ``max_bytes`` is exceeded, whole bundles are evicted oldest first. A
+    screenshot that another bundle's ``meta.json`` still points at is kept
+    until the last such bundle goes.
+    """
+
+    def __init__(self, root: str = ARTIFACTS_DIR, max_bytes: int = DEFAULT_MAX_BYTES, workers: int = 2):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.current_test = NO_TEST
+        self._pool = None
+        self._pending = []
+        self._lock = threading.Lock()
+        self._files: dict[str, int] = None              # path -> size on disk
+        self._bundles: OrderedDict[str, None] = None    # bundle directories, oldest first
+        self._frames: dict[str, str] = {}               # screenshot sha1 -> path on disk
+        self._frame_users: dict[str, set] = {}          # screenshot path -> bundles whose meta points at it
+        self._total = 0
+        self.errors: list[str] = []
+
+    def capture(self, driver, label: str, dom: bool = True, console: bool = True) -> str:
+        """Grab the current page state and queue it for writing; returns the bundle path.
+
+        Never raises: a browser that cannot be read (e.g. already closed) yields "".
+        """
+        try:
+            screenshot = driver.get_screenshot_as_base64()
+            url, html = driver.execute_script(_DOM_SCRIPT) if dom else (None, None)
+        except WebDriverException:
+            return ""
+        logs = self._console_log(driver) if console else []
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        bundle = os.path.join(
+            self.root, _safe_name(self.current_test), f"{timestamp}_{_safe_name(label, 60)}"
+        )
+        meta = {"test": self.current_test, "label": label, "url": url, "captured_at": timestamp}
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="artifacts")
+            self._pending = [future for future in self._pending if not future.done()]
+            self._pending.append(self._pool.submit(self._write, bundle, meta, screenshot, html, logs))
+        return bundle
+
+    @staticmethod
+    def _console_log(driver) -> list:
+        # Only Chromium drivers started with goog:/ms:loggingPrefs expose the browser log
+        try:
+            return driver.get_log("browser")
+        except (WebDriverException, AttributeError, ValueError):
+            return []
+
+    def flush(self):
+        """Block until every queued capture is on disk.
+
+        A write that failed is logged and kept in ``errors``; it never raises
+        here, so a lost artifact cannot turn into a pytest internal error.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            error = future.exception()
+            if error is not None:
+                message = f"{type(error).__name__}: {error}"
+                self.errors.append(message)
+                logger.warning("Failed to write failure artifact: %s", message)
+
+    def close(self):
+        self.flush()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def _write(self, bundle, meta, screenshot, html, logs):
+        os.makedirs(bundle, exist_ok=True)
+        png = base64.b64decode(screenshot)
+        digest = hashlib.sha1(png).hexdigest()
+
+        with self._lock:
+            self._load_index()
+            self._bundles[bundle] = None
+            frame = self._frames.get(digest)
+            if frame is None:
+                frame = os.path.join(bundle, "screenshot.png")
+                self._frames[digest] = frame
+            # Pins the frame (possibly still in flight) for as long as this bundle exists
+            self._frame_users.setdefault(frame, set()).add(bundle)
+
+        if frame.startswith(bundle):
+            self._store(frame, png)
+        if html is not None:
+            self._store(os.path.join(bundle, "dom.html.gz"), gzip.compress(html.encode("utf-8")))
+        if logs:
+            self._store(os.path.join(bundle, "console.json"), json.dumps(logs, indent=2).encode("utf-8"))
+
+        meta = dict(meta, screenshot=frame, sha1=digest)
+        self._store(os.path.join(bundle, "meta.json"), json.dumps(meta, indent=2).encode("utf-8"))
+
+    def _store(self, path, data: bytes):
+        with open(path, "wb") as fh:
+            fh.write(data)
+        with self._lock:
+            self._total += len(data) - self._files.get(path, 0)
+            self._files[path] = len(data)
+            self._evict()
+
+    def _load_index(self):
+        """Index bundles left by earlier runs (oldest first) so the cap spans runs. Call under lock.
+
+        Only ``<root>/<test id>/<bundle>/`` directories holding a ``meta.json``
+        count as bundles; anything else under the root (older ``fail_*.png``
+        files, other workers' folders) is not the store's to evict.
+        """
+        if self._files is not None:
+            return
+        self._files = {}
+        newest = {}
+        for test_dir in self._subdirs(self.root):
+            for bundle in self._subdirs(test_dir):
+                meta = os.path.join(bundle, "meta.json")
+                if not os.path.isfile(meta):
+                    continue
+                for entry in os.scandir(bundle):
+                    if entry.is_file():
+                        stat = entry.stat()
+                        self._files[entry.path] = stat.st_size
+                        newest[bundle] = max(newest.get(bundle, 0.0), stat.st_mtime)
+                self._index_meta(bundle, meta)
+        # Dedupe only against frames that are really on disk inside a bundle
+        self._frames = {digest: frame for digest, frame in self._frames.items() if frame in self._files}
+        self._bundles = OrderedDict((d, None) for d in sorted(newest, key=newest.get))
+        self._total = sum(self._files.values())
+
+    @staticmethod
+    def _subdirs(directory):
+        try:
+            return [entry.path for entry in os.scandir(directory) if entry.is_dir()]
+        except OSError:
+            return []
+
+    def _index_meta(self, bundle, path):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                meta = json.load(fh)
+        except (OSError, ValueError):
+            return
+        frame = meta.get("screenshot")
+        if frame:
+            self._frame_users.setdefault(frame, set()).add(bundle)
+            if meta.get("sha1"):
+                self._frames.setdefault(meta["sha1"], frame)
+
+    def _evict(self):
+        """Delete whole bundles, oldest first, until under the cap. Call under lock."""
+        while self._total > self.max_bytes and len(self._bundles) > 1:
+            bundle, _ = self._bundles.popitem(last=False)
+            for frame, users in list(self._frame_users.items()):
+                if bundle in users:
+                    users.discard(bundle)
+                    if not users:
+                        del self._frame_users[frame]
+                        if frame in self._files:
+                            self._remove(frame)
+            for path in [p for p in self._files if os.path.dirname(p) == bundle]:
+                if path not in self._frame_users:
+                    self._remove(path)
+
+    def _remove(self, path):
+        """Forget and delete one file, and its directory once empty. Call under lock."""
+        self._total -= self._files.pop(path, 0)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        for digest, frame in list(self._frames.items()):
+            if frame == path:
+                del self._frames[digest]
+        directory = os.path.dirname(path)
+        if directory != self.root and os.path.isdir(directory) and not os.listdir(directory):
+            os.rmdir(directory)
+
+
+STORE = ArtifactStore()
+
+
+def capture_failure(driver, label: str) -> str:
+    """Queue a failure bundle for ``driver`` in the shared store; returns the bundle path."""
+    return STORE.capture(driver, label)
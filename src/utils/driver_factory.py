@@ -0,0 +1,194 @@
+import json
+
+from selenium import webdriver
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+SUPPORTED_BROWSERS = ("chrome", "edge")
+
+# full     — visible browser, maximised, default settings
+# headless — headless browser with a fixed viewport
+# lean     — headless plus everything the tests do not need switched off
+PROFILES = ("full", "headless", "lean")
+
+WINDOW_SIZE = (1920, 1080)
+
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
+# Chrome DevTools Network.setBlockedURLs patterns ("*" is the only wildcard)
+TRACKER_URL_PATTERNS = (
+    "*backtrace.io*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*optimizely.com*",
+)
+MEDIA_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp",
+    "*.woff", "*.woff2", "*.ttf",
+)
+DEFAULT_BLOCKED_URLS = TRACKER_URL_PATTERNS + MEDIA_URL_PATTERNS
+
+# Keep-alive connections held open to a Grid hub. A single-threaded test only ever
+# uses one; the headroom keeps sockets reusable when code drives the same session
+# from several threads, where urllib3's default pool of 1 would discard the extras.
+GRID_POOL_SIZE = 8
+
+# Lets failure artifacts read the browser console through driver.get_log("browser")
+BROWSER_LOG_PREFS = {"browser": "ALL"}
+
+LEAN_ARGUMENTS = (
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-remote-fonts",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+)
+
+
+def build_options(
+    browser_name: str,
+    profile: str = "full",
+    app_host: str | None = None,
+    page_load_strategy: str | None = None,
+):
+    """Return Chrome/Edge options for a launch profile.
+
+    app_host is the only host the lean profile resolves; every other (third-party)
+    host fails DNS so trackers and CDNs are never fetched. page_load_strategy
+    overrides the profile's default ("eager" for lean, "normal" otherwise).
+    """
+    if browser_name not in SUPPORTED_BROWSERS:
+        raise ValueError(
+            f"Unsupported browser: '{browser_name}'. Valid browsers: {list(SUPPORTED_BROWSERS)}"
+        )
+    if profile not in PROFILES:
+        raise ValueError(f"Unsupported profile: '{profile}'. Valid profiles: {list(PROFILES)}")
+    if page_load_strategy and page_load_strategy not in PAGE_LOAD_STRATEGIES:
+        raise ValueError(
+            f"Unsupported page load strategy: '{page_load_strategy}'. "
+            f"Valid strategies: {list(PAGE_LOAD_STRATEGIES)}"
+        )
+
+    options = webdriver.ChromeOptions() if browser_name == "chrome" else webdriver.EdgeOptions()
+    options.set_capability(
+        "goog:loggingPrefs" if browser_name == "chrome" else "ms:loggingPrefs", BROWSER_LOG_PREFS
+    )
+    if page_load_strategy:
+        options.page_load_strategy = page_load_strategy
+    if profile == "full":
+        return options
+
+    options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={WINDOW_SIZE[0]},{WINDOW_SIZE[1]}")
+
+    if profile == "lean":
+        options.page_load_strategy = page_load_strategy or "eager"
+        for argument in LEAN_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        if app_host:
+            options.add_argument(f"--host-resolver-rules=MAP * ~NOTFOUND, EXCLUDE {app_host}")
+
+    return options
+
+
+def create_driver(
+    browser_name: str,
+    profile: str = "full",
+    app_host: str | None = None,
+    page_load_strategy: str | None = None,
+):
+    """Launch a local Chrome/Edge session configured for the given profile."""
+    options = build_options(browser_name, profile, app_host, page_load_strategy)
+    driver = webdriver.Chrome(options=options) if browser_name == "chrome" \
+        else webdriver.Edge(options=options)
+
+    if profile == "full":
+        driver.maximize_window()
+    return driver
+
+
+def parse_capability(spec: str) -> tuple[str, object]:
+    """Split a ``key=value`` capability; the value is read as JSON when it parses.
+
+    ``browserVersion=126`` -> ("browserVersion", 126); ``se:recordVideo=true`` -> True;
+    anything that is not valid JSON is kept as a string.
+    """
+    key, sep, raw = spec.partition("=")
+    if not sep or not key.strip():
+        raise ValueError(f"Invalid capability: '{spec}'. Expected key=value")
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = raw
+    return key.strip(), value
+
+
+def create_remote_driver(
+    grid_url: str,
+    browser_name: str,
+    profile: str = "full",
+    app_host: str | None = None,
+    page_load_strategy: str | None = None,
+    capabilities: dict | None = None,
+    pool_size: int = GRID_POOL_SIZE,
+    timeout: float | None = None,
+):
+    """Start a session on a Selenium Grid (or any remote WebDriver endpoint).
+
+    Uses the same options as ``create_driver`` plus any extra ``capabilities``.
+    The HTTP connection to the hub is keep-alive with a pool of ``pool_size``
+    sockets, so commands reuse connections instead of paying a TCP handshake each.
+    """
+    if pool_size < 1:
+        raise ValueError(f"Invalid pool size: {pool_size}. Must be at least 1")
+
+    options = build_options(browser_name, profile, app_host, page_load_strategy)
+    for key, value in (capabilities or {}).items():
+        options.set_capability(key, value)
+
+    client_config = ClientConfig(
+        remote_server_addr=grid_url,
+        keep_alive=True,
+        # RemoteConnection reads the urllib3 PoolManager kwargs from this nested key
+        init_args_for_pool_manager={"init_args_for_pool_manager": {"maxsize": pool_size}},
+        timeout=timeout,
+    )
+    driver = webdriver.Remote(
+        command_executor=RemoteConnection(client_config=client_config),
+        options=options,
+    )
+
+    if profile == "full":
+        driver.maximize_window()
+    return driver
+
+
+def block_urls(driver, patterns=DEFAULT_BLOCKED_URLS) -> bool:
+    """Block matching requests through Chrome DevTools; an empty list lifts the block.
+
+    The active patterns are remembered on the driver, so asking for the set
+    already in force sends no DevTools command. Returns False when the driver
+    has no DevTools access (e.g. a non-Chromium browser or a Grid session), in
+    which case nothing is blocked.
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    patterns = tuple(patterns)
+    current = getattr(driver, "blocked_url_patterns", ())
+    if patterns == current:
+        return True
+    if not getattr(driver, "cdp_network_enabled", False):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.cdp_network_enabled = True
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    driver.blocked_url_patterns = patterns
+    return True
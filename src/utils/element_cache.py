@@ -0,0 +1,87 @@
+from selenium.common.exceptions import WebDriverException
+
+from src.utils.waits import FIND_JS
+
+# Checks every cached element in one call: still attached, still the first match for
+# its locator (what find_element would return now), and whether it is visible and enabled.
+# Passing a detached element makes the driver reject the whole call, which the cache
+# treats as "drop everything".
+_PROBE_SCRIPT = FIND_JS + """
+    const [entries] = arguments;
+    window.__pageToken = window.__pageToken || Math.random().toString(36).slice(2);
+    return [window.__pageToken, entries.map(([el, by, value]) => {
+        const current = !!el && el.isConnected && findAll(by, value)[0] === el;
+        return [current, current && visible(el), current && !el.disabled];
+    })];
+"""
+
+
+class ElementCache:
+    """locator -> WebElement for the current document, shared by every page object on a driver.
+
+    A lookup sends one probe that revalidates all cached elements together.
+    The probe replaces ``find_element`` and, for visibility and clickability
+    checks, the ``is_displayed`` and ``is_enabled`` calls as well. Entries that detached or no longer match
+    their locator are dropped. The whole cache is dropped when the page token
+    changes, when any cached element has gone stale, or on ``clear()``, which
+    ``BasePage.navigate_url`` calls.
+    """
+
+    def __init__(self):
+        self.token = None
+        self.elements: dict[tuple, object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, driver, locator) -> tuple[object, bool, bool] | None:
+        """Return (element, visible, enabled) for a cached locator still valid in the page, else None."""
+        locator = tuple(locator)
+        if locator not in self.elements:
+            self.misses += 1
+            return None
+
+        keys = list(self.elements)
+        try:
+            token, states = driver.execute_script(
+                _PROBE_SCRIPT, [[self.elements[key], *key] for key in keys]
+            )
+        except WebDriverException:
+            self.clear()
+            self.misses += 1
+            return None
+
+        if self.token is not None and token != self.token:
+            self.clear()
+            self.misses += 1
+            return None
+        self.token = token
+
+        result = None
+        for key, (current, visible, enabled) in zip(keys, states):
+            if not current:
+                del self.elements[key]
+            elif key == locator:
+                result = (self.elements[key], visible, enabled)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def store(self, locator, element):
+        self.elements[tuple(locator)] = element
+
+    def discard(self, locator):
+        self.elements.pop(tuple(locator), None)
+
+    def clear(self):
+        self.token = None
+        self.elements.clear()
+
+
+def element_cache(driver) -> ElementCache:
+    """Return the driver's element cache, attaching an empty one on first use."""
+    cache = getattr(driver, "element_cache", None)
+    if cache is None:
+        cache = driver.element_cache = ElementCache()
+    return cache
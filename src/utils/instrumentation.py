@@ -0,0 +1,167 @@
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import NamedTuple
+
+_PAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pages")
+_WAITS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "waits.py")
+
+NO_TEST = "<session>"
+
+# WebDriver commands that load a document
+NAVIGATION_COMMANDS = ("get", "goBack", "goForward", "refresh")
+
+
+class CommandRecord(NamedTuple):
+    """One WebDriver command as seen on the wire."""
+
+    test: str
+    command: str
+    duration: float
+    page_method: str
+    in_wait: bool
+
+
+class WaitRecord(NamedTuple):
+    """One call to a ``src.utils.waits`` helper, including the time spent polling."""
+
+    test: str
+    label: str
+    duration: float
+
+
+def _caller_info() -> tuple[str, bool]:
+    """Return (outermost page-object method on the stack, whether a wait helper is active)."""
+    page_method = ""
+    in_wait = False
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename == _WAITS_FILE:
+            in_wait = True
+        elif filename.startswith(_PAGES_DIR):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            page_method = f"{type(owner).__name__}.{name}" if owner is not None else name
+        frame = frame.f_back
+    return page_method, in_wait
+
+
+class OperationMetrics:
+    """Per-operation counters for ``BasePage`` element operations (click, type, ...)."""
+
+    def __init__(self):
+        self.operations = defaultdict(lambda: {
+            "calls": 0, "failures": 0, "retries": 0, "handle_reuses": 0, "time": 0.0,
+        })
+
+    def record(self, name: str, duration: float, retries: int, reused: bool, failed: bool):
+        entry = self.operations[name]
+        entry["calls"] += 1
+        entry["failures"] += failed
+        entry["retries"] += retries
+        entry["handle_reuses"] += reused
+        entry["time"] += duration
+
+    def report(self) -> dict:
+        return {name: dict(entry) for name, entry in self.operations.items()}
+
+
+def operation_metrics(driver) -> OperationMetrics:
+    """Return the driver's operation metrics, attaching a fresh set on first use."""
+    metrics = getattr(driver, "operation_metrics", None)
+    if metrics is None:
+        metrics = driver.operation_metrics = OperationMetrics()
+    return metrics
+
+
+class CommandRecorder:
+    """Record every WebDriver command a driver sends, with timing and attribution.
+
+    ``install`` wraps ``driver.execute`` on the instance, which every driver and
+    WebElement command goes through. ``current_test`` is set by the caller
+    (conftest) so each record is tagged with the test that issued it.
+    """
+
+    def __init__(self):
+        self.current_test = NO_TEST
+        self.commands: list[CommandRecord] = []
+        self.waits: list[WaitRecord] = []
+        self.operations = OperationMetrics()
+
+    def install(self, driver):
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            page_method, in_wait = _caller_info()
+            start = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                self.commands.append(CommandRecord(
+                    self.current_test, driver_command, time.perf_counter() - start,
+                    page_method, in_wait,
+                ))
+
+        driver.execute = execute
+        driver.command_recorder = self
+        driver.operation_metrics = self.operations
+        return driver
+
+    def add_wait(self, label: str, duration: float):
+        self.waits.append(WaitRecord(self.current_test, label, duration))
+
+    def report(self, top: int = 20) -> dict:
+        """Return a per-test breakdown plus a session summary."""
+        tests = defaultdict(lambda: {
+            "command_count": 0,
+            "navigations": 0,
+            "wire_time": 0.0,
+            "wait_time": 0.0,
+            "by_method": defaultdict(lambda: {"count": 0, "wire_time": 0.0}),
+            "by_command": defaultdict(lambda: {"count": 0, "wire_time": 0.0}),
+        })
+
+        for record in self.commands:
+            entry = tests[record.test]
+            entry["command_count"] += 1
+            entry["navigations"] += record.command in NAVIGATION_COMMANDS
+            entry["wire_time"] += record.duration
+            for bucket, key in (("by_method", record.page_method or "<test>"),
+                                ("by_command", record.command)):
+                entry[bucket][key]["count"] += 1
+                entry[bucket][key]["wire_time"] += record.duration
+
+        for record in self.waits:
+            tests[record.test]["wait_time"] += record.duration
+
+        slowest = sorted(self.commands, key=lambda r: r.duration, reverse=True)[:top]
+        return {
+            "summary": {
+                "tests": len([name for name in tests if name != NO_TEST]),
+                "command_count": len(self.commands),
+                "navigations": sum(r.command in NAVIGATION_COMMANDS for r in self.commands),
+                "wire_time": sum(r.duration for r in self.commands),
+                "wait_time": sum(r.duration for r in self.waits),
+                "top_slow_calls": [record._asdict() for record in slowest],
+                "operations": self.operations.report(),
+            },
+            "tests": tests,
+        }
+
+    def write_report(self, path: str, top: int = 20) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.report(top), fh, indent=2)
+        return path
+
+
+def record_wait(driver, label: str, duration: float):
+    """Report time spent in a wait helper to the driver's recorder, if one is installed."""
+    recorder = getattr(driver, "command_recorder", None)
+    if recorder is not None:
+        recorder.add_wait(label, duration)
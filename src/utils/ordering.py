@@ -0,0 +1,124 @@
+from typing import NamedTuple
+
+LOGGED_IN = "logged_in"
+LOGGED_OUT = "logged_out"
+
+# Fixtures that put the browser in a logged-in state before the test body runs
+LOGGED_IN_FIXTURES = ("app_login", "clean_cart")
+
+
+class StartState(NamedTuple):
+    """The browser state a test expects when its body starts."""
+
+    auth: str               # LOGGED_IN or LOGGED_OUT
+    page: str | None        # page name from @pytest.mark.start_state(page=...), if any
+
+
+# Every module starts logged out (see ``fresh_module_state`` in conftest)
+MODULE_START = StartState(LOGGED_OUT, None)
+
+
+def required_state(item) -> StartState:
+    """Derive a test's start state from its fixtures; ``start_state`` marker kwargs override."""
+    fixtures = getattr(item, "fixturenames", ())
+    auth = LOGGED_IN if any(name in fixtures for name in LOGGED_IN_FIXTURES) else LOGGED_OUT
+    page = None
+
+    marker = item.get_closest_marker("start_state")
+    if marker is not None:
+        auth = marker.kwargs.get("auth", auth)
+        page = marker.kwargs.get("page", page)
+    return StartState(auth, page)
+
+
+def transition_cost(current: StartState, target: StartState) -> int:
+    """Number of state changes (login/logout, page switch) needed to go from current to target."""
+    cost = int(current.auth != target.auth)
+    if target.page is not None and current.page != target.page:
+        cost += 1
+    return cost
+
+
+def _path_cost(states) -> int:
+    """Transitions needed to visit ``states`` in order, starting from MODULE_START."""
+    total = 0
+    current = MODULE_START
+    for target in states:
+        total += transition_cost(current, target)
+        current = target
+    return total
+
+
+def count_transitions(items) -> int:
+    """Total transitions a run in this order would make, restarting each scope at MODULE_START."""
+    return sum(
+        _path_cost(required_state(item) for item in scope_items)
+        for scope_items in _scopes(items).values()
+    )
+
+
+def _scopes(items) -> dict[str, list]:
+    """Group items by their parent collector (module or class), keeping first-seen order.
+
+    Items never move across these groups, so module- and class-scoped fixtures
+    still set up once and pytest-xdist ``--dist loadscope`` sees the same scopes.
+    Grouping by the parent rather than by splitting the node id keeps
+    parametrized ids that contain "::" in their own scope.
+    """
+    scopes: dict[str, list] = {}
+    for item in items:
+        scopes.setdefault(item.parent.nodeid, []).append(item)
+    return scopes
+
+
+def reorder(items) -> list:
+    """Order tests inside each scope so consecutive tests share a start state.
+
+    Greedy: from the scope's start state, repeatedly take the earliest remaining
+    test that is cheapest to reach. Ties keep the original file order. A scope
+    keeps its original order unless the greedy order needs strictly fewer
+    transitions, so the total never increases.
+    """
+    states = {item.nodeid: required_state(item) for item in items}
+    ordered = []
+    for scope_items in _scopes(items).values():
+        remaining = list(scope_items)
+        greedy = []
+        state = MODULE_START
+        while remaining:
+            best = min(
+                range(len(remaining)),
+                key=lambda i: (transition_cost(state, states[remaining[i].nodeid]), i),
+            )
+            item = remaining.pop(best)
+            greedy.append(item)
+            state = states[item.nodeid]
+
+        greedy_cost = _path_cost(states[item.nodeid] for item in greedy)
+        original_cost = _path_cost(states[item.nodeid] for item in scope_items)
+        ordered.extend(greedy if greedy_cost < original_cost else scope_items)
+    return ordered
+
+
+class SessionTracker:
+    """What the browser is known to hold between tests, so state fixtures can skip work.
+
+    ``user`` is the account a state fixture last logged in (None once logged
+    out). A recorded user is only a hint: fixtures confirm it against the
+    browser before skipping a login.
+    """
+
+    def __init__(self):
+        self.user: str | None = None
+        self.transitions_before = 0
+        self.transitions_after = 0
+        self.logins_run = 0
+        self.logins_skipped = 0
+        self.logouts = 0
+
+    def summary(self) -> str:
+        return (
+            f"state transitions {self.transitions_before} -> {self.transitions_after}; "
+            f"logins {self.logins_run} run, {self.logins_skipped} skipped; "
+            f"{self.logouts} logouts"
+        )
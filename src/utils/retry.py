@@ -0,0 +1,41 @@
+import random
+import time
+from dataclasses import dataclass
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How ``BasePage`` element operations retry.
+
+    An operation runs at most ``attempts`` times. Only exceptions in
+    ``retry_on`` trigger a retry; anything else, including a wait timing out,
+    fails at once. Before retry n the operation sleeps ``backoff * 2 ** (n - 1)``
+    seconds, randomised by +/- ``jitter`` of that delay, so parallel workers
+    hitting the same re-render do not retry in lockstep.
+    """
+
+    attempts: int = 2
+    backoff: float = 0.05
+    jitter: float = 0.5
+    retry_on: tuple[type[Exception], ...] = (StaleElementReferenceException,)
+
+    def __post_init__(self):
+        if self.attempts < 1:
+            raise ValueError(f"Invalid attempts: {self.attempts}. Must be at least 1")
+
+    def delay(self, retry: int) -> float:
+        base = self.backoff * 2 ** (retry - 1)
+        return max(0.0, base * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def pause(self, retry: int):
+        """Sleep for the backoff before retry ``retry``."""
+        time.sleep(self.delay(retry))
+
+
+# One retry on a stale element, as BasePage.click always did
+DEFAULT_RETRY = RetryPolicy()
+
+# No retries: the first error is final
+FAST_FAIL = RetryPolicy(attempts=1)
@@ -1,20 +1,438 @@
-from selenium.webdriver.support.wait import WebDriverWait
+import time
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.support import expected_conditions as EC
 
-DEFAULT_TIMEOUT = 10
+from src.utils.instrumentation import record_wait
+
+
+@dataclass
+class WaitConfig:
+    """Global knobs for every helper in this module; change them with ``configure``.
+
+    Polling starts at ``initial_poll`` seconds and backs off by ``backoff`` up to
+    ``max_poll``, so an element that shows up after 20 ms is seen within a few ms
+    instead of Selenium's fixed 500 ms interval.
+
+    With ``adaptive_timeouts`` on, a wait without an explicit timeout uses
+    ``learned_timeout_factor`` x the slowest time that locator has taken so far
+    this session (never below ``min_learned_timeout`` or above ``timeout``), so
+    waits that are going to fail, fail sooner.
+
+    ``mode`` picks how element waits run: "poll" issues WebDriver commands from
+    Python; "observer" installs a MutationObserver in the page and resolves in a
+    single ``execute_async_script`` round-trip as soon as the DOM matches.
+    """
+
+    timeout: float = 10
+    initial_poll: float = 0.005
+    max_poll: float = 0.25
+    backoff: float = 2.0
+    adaptive_timeouts: bool = False
+    learned_timeout_factor: float = 3.0
+    min_learned_timeout: float = 2.0
+    mode: str = "poll"
+
+
+CONFIG = WaitConfig()
+
+# Kept for callers that import it; reflects the default config
+DEFAULT_TIMEOUT = CONFIG.timeout
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+WAIT_MODES = ("poll", "observer")
+
+# Browsers default to a 30 s async script timeout
+_DEFAULT_SCRIPT_TIMEOUT = 30
+
+# JS prelude defining findAll(by, value) for any Selenium By strategy and visible(el).
+# Shared by the scripts below and by any page-side script that takes a locator.
+FIND_JS = """
+    const findAll = (by, value) => {
+        switch (by) {
+            case 'id': return Array.from(document.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+            case 'class name': return Array.from(document.getElementsByClassName(value));
+            case 'name': return Array.from(document.getElementsByName(value));
+            case 'tag name': return Array.from(document.getElementsByTagName(value));
+            case 'css selector': return Array.from(document.querySelectorAll(value));
+            case 'xpath': {
+                const found = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+            }
+            case 'link text':
+                return Array.from(document.links).filter(a => a.innerText.trim() === value);
+            case 'partial link text':
+                return Array.from(document.links).filter(a => a.innerText.includes(value));
+        }
+        return [];
+    };
+    const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+        && getComputedStyle(el).visibility !== 'hidden';
+"""
+
+# Resolves with the element (or element list) once `state` holds, or null on timeout.
+# A MutationObserver catches DOM/attribute changes; a slow interval backs it up for
+# changes that produce no mutation (CSS transitions, layout).
+_OBSERVE_SCRIPT = FIND_JS + """
+    const [by, value, state, name, expected, timeoutMs, done] = arguments;
+
+    const check = () => {
+        const all = findAll(by, value);
+        const el = all[0];
+        switch (state) {
+            case 'present': return el || null;
+            case 'visible': return el && visible(el) ? el : null;
+            case 'clickable': return el && visible(el) && !el.disabled ? el : null;
+            case 'all_visible': return all.length && all.every(visible) ? all : null;
+            case 'attribute': return el && el.getAttribute(name) === expected ? el : null;
+        }
+        return null;
+    };
+
+    const first = check();
+    if (first) return done(first);
+
+    let finished = false;
+    const finish = result => {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearInterval(interval);
+        clearTimeout(timer);
+        done(result);
+    };
+    const recheck = () => { const result = check(); if (result) finish(result); };
+    const observer = new MutationObserver(recheck);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    const interval = setInterval(recheck, 50);
+    const timer = setTimeout(() => finish(null), timeoutMs);
+"""
+
+# Evaluates every named condition spec once; returns [fired names, {name: value}]
+_CONDITIONS_SCRIPT = FIND_JS + """
+    const fired = [];
+    const values = {};
+    for (const [key, spec] of Object.entries(arguments[0])) {
+        const all = spec.by ? findAll(spec.by, spec.value) : [];
+        const el = all[0];
+        const want = spec.expected;
+        let value, ok;
+        switch (spec.kind) {
+            case 'visible':
+                value = !!el && visible(el);
+                ok = value === (want === null ? true : want);
+                break;
+            case 'text':
+                value = el ? el.innerText.trim() : null;
+                ok = want === null ? !!value : value === want;
+                break;
+            case 'count':
+                value = all.length;
+                ok = want === null ? value > 0 : value === want;
+                break;
+            case 'url_contains':
+                value = location.href;
+                ok = value.includes(want);
+                break;
+            case 'attribute':
+                value = el ? el.getAttribute(spec.name) : null;
+                ok = want === null ? value !== null : value === want;
+                break;
+        }
+        values[key] = value;
+        if (ok) fired.push(key);
+    }
+    return [fired, values];
+"""
+
+# locator -> {"count": successful waits, "max": slowest success (s), "total": summed time (s)}
+_latency: dict[tuple, dict] = {}
+
+
+def configure(**overrides) -> WaitConfig:
+    """Update the global wait config, e.g. ``configure(max_poll=0.1, adaptive_timeouts=True)``."""
+    for name, value in overrides.items():
+        if not hasattr(CONFIG, name):
+            raise ValueError(f"Unknown wait setting: '{name}'")
+        if name == "mode" and value not in WAIT_MODES:
+            raise ValueError(f"Invalid wait mode: '{value}'. Valid modes: {list(WAIT_MODES)}")
+        setattr(CONFIG, name, value)
+    return CONFIG
+
+
+def latency_stats() -> dict[tuple, dict]:
+    """Return a copy of the per-locator latency observed so far."""
+    return {locator: dict(stats) for locator, stats in _latency.items()}
+
+
+def reset_latency_stats():
+    _latency.clear()
+
+
+def _timeout_for(locator, timeout):
+    if timeout is not None:
+        return timeout
+    stats = _latency.get(locator)
+    if not CONFIG.adaptive_timeouts or not stats:
+        return CONFIG.timeout
+    learned = stats["max"] * CONFIG.learned_timeout_factor
+    return min(CONFIG.timeout, max(CONFIG.min_learned_timeout, learned))
+
+
+def _learn(locator, elapsed):
+    stats = _latency.setdefault(locator, {"count": 0, "max": 0.0, "total": 0.0})
+    stats["count"] += 1
+    stats["total"] += elapsed
+    stats["max"] = max(stats["max"], elapsed)
+
+
+def _until(driver, condition, timeout, label, locator=None):
+    """Poll ``condition`` with exponential backoff, checking once before any sleep."""
+    timeout = _timeout_for(locator, timeout)
+    start = time.perf_counter()
+    deadline = start + timeout
+    delay = CONFIG.initial_poll
+    try:
+        while True:
+            try:
+                value = condition(driver)
+                if value:
+                    if locator is not None:
+                        _learn(locator, time.perf_counter() - start)
+                    return value
+            except IGNORED_EXCEPTIONS:
+                pass
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise TimeoutException(f"Timed out after {timeout}s waiting for {label}")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * CONFIG.backoff, CONFIG.max_poll)
+    finally:
+        record_wait(driver, label, time.perf_counter() - start)
+
+
+def _attribute_equals(locator, name, expected):
+    def condition(driver):
+        element = driver.find_element(*locator)
+        return element if element.get_attribute(name) == expected else False
+    return condition
+
+
+def _poll_condition(locator, state, name=None, expected=None):
+    if state == "attribute":
+        return _attribute_equals(locator, name, expected)
+    return {
+        "present": EC.presence_of_element_located,
+        "visible": EC.visibility_of_element_located,
+        "clickable": EC.element_to_be_clickable,
+        "all_visible": EC.visibility_of_all_elements_located,
+    }[state](locator)
+
+
+def ensure_script_timeout(driver, seconds: float):
+    """Raise the session's async script timeout to at least ``seconds``; never lowers it.
+
+    The value set is remembered on the driver, so repeat calls cost no WebDriver command.
+    """
+    if seconds > getattr(driver, "wait_script_timeout", _DEFAULT_SCRIPT_TIMEOUT):
+        driver.set_script_timeout(seconds)
+        driver.wait_script_timeout = seconds
+
+
+def _observe(driver, locator, state, timeout, label, name=None, expected=None):
+    """Wait in the browser via MutationObserver; fall back to polling if the page unloads."""
+    timeout = _timeout_for(locator, timeout)
+    ensure_script_timeout(driver, timeout + 1)
+
+    start = time.perf_counter()
+    try:
+        result = driver.execute_async_script(
+            _OBSERVE_SCRIPT, locator[0], locator[1], state, name, expected, int(timeout * 1000)
+        )
+    except TimeoutException:
+        result = None
+    except WebDriverException:
+        # Navigation tore the script down mid-wait; finish on the new document by polling
+        remaining = max(0.0, timeout - (time.perf_counter() - start))
+        return _until(driver, _poll_condition(locator, state, name, expected),
+                      remaining, label, locator)
+    finally:
+        elapsed = time.perf_counter() - start
+
+    record_wait(driver, label, elapsed)
+    if not result:
+        raise TimeoutException(f"Timed out after {timeout}s waiting for {label}")
+    _learn(locator, elapsed)
+    return result
+
+
+def _wait(driver, locator, state, timeout, name=None, expected=None):
+    label = f"{state} {locator}" if state != "attribute" \
+        else f"{locator} [{name}={expected!r}]"
+    if CONFIG.mode == "observer":
+        return _observe(driver, locator, state, timeout, label, name, expected)
+    return _until(driver, _poll_condition(locator, state, name, expected), timeout, label, locator)
+
+
+def wait_visible(driver, locator, timeout=None):
+    return _wait(driver, locator, "visible", timeout)
+
+
+def wait_clickable(driver, locator, timeout=None):
+    return _wait(driver, locator, "clickable", timeout)
+
+
+def wait_all_visible(driver, locator, timeout=None):
+    return _wait(driver, locator, "all_visible", timeout)
+
+
+def presence_located(driver, locator, timeout=None):
+    return _wait(driver, locator, "present", timeout)
+
+
+def wait_attribute(driver, locator, name, expected, timeout=None):
+    """Wait until the element's attribute ``name`` equals ``expected``; return the element."""
+    return _wait(driver, locator, "attribute", timeout, name, expected)
+
+
+# Resolves once the document has loaded and two animation frames have run (so a render
+# scheduled by the last action has committed), with the element if it is then visible,
+# else null. The timer caps the wait where frames are throttled (background tabs).
+_SETTLED_SCRIPT = FIND_JS + """
+    const [by, value, timeoutMs, done] = arguments;
+    let finished = false;
+    const finish = () => {
+        if (finished) return;
+        finished = true;
+        const el = findAll(by, value)[0];
+        done(el && visible(el) ? el : null);
+    };
+    const frames = () => requestAnimationFrame(() => requestAnimationFrame(finish));
+    if (document.readyState === 'complete') frames();
+    else window.addEventListener('load', frames, {once: true});
+    setTimeout(finish, timeoutMs);
+"""
+
+
+def settled_visible(driver, locator, timeout=None):
+    """Return the element if it is visible once the page has settled, else None.
+
+    Settled means the document has loaded and pending renders have painted.
+    For elements that either appear as a direct result of the last action or
+    not at all (validation errors, images), this answers "absent" in a frame
+    or two instead of waiting out a visibility timeout. A page that unloads
+    mid-check is checked again on the new document.
+    """
+    timeout = CONFIG.timeout if timeout is None else timeout
+    ensure_script_timeout(driver, timeout + 1)
+
+    label = f"settled {locator}"
+    start = time.perf_counter()
+    try:
+        for _attempt in range(2):
+            remaining = max(0.0, timeout - (time.perf_counter() - start))
+            try:
+                return driver.execute_async_script(
+                    _SETTLED_SCRIPT, locator[0], locator[1], int(remaining * 1000)
+                )
+            except TimeoutException:
+                return None
+            except WebDriverException:
+                continue
+        return None
+    finally:
+        record_wait(driver, label, time.perf_counter() - start)
+
+
+class Condition:
+    """Builders for the named condition specs taken by ``wait_any``, ``wait_all`` and ``gather``.
+
+    Every spec gathers a value on each evaluation and fires when it matches
+    ``expected``; with ``expected=None`` it fires on any "truthy" reading.
+    """
+
+    @staticmethod
+    def _spec(kind, locator=None, expected=None, name=None) -> dict:
+        by, value = locator if locator else (None, None)
+        return {"kind": kind, "by": by, "value": value, "expected": expected, "name": name}
+
+    @staticmethod
+    def visible(locator, expected: bool = True) -> dict:
+        """Value: whether the first match is displayed. ``expected=False`` waits for it to go."""
+        return Condition._spec("visible", locator, expected)
+
+    @staticmethod
+    def text(locator, expected: str | None = None) -> dict:
+        """Value: stripped text of the first match, or None when absent."""
+        return Condition._spec("text", locator, expected)
+
+    @staticmethod
+    def count(locator, expected: int | None = None) -> dict:
+        """Value: number of matches."""
+        return Condition._spec("count", locator, expected)
+
+    @staticmethod
+    def url_contains(fragment: str) -> dict:
+        """Value: the current URL."""
+        return Condition._spec("url_contains", expected=fragment)
+
+    @staticmethod
+    def attribute(locator, name: str, expected: str | None = None) -> dict:
+        """Value: the attribute of the first match, or None when absent."""
+        return Condition._spec("attribute", locator, expected, name)
+
+
+class ConditionResult(NamedTuple):
+    """Outcome of one evaluation of a set of named conditions."""
+
+    fired: tuple[str, ...]
+    values: dict
+
+    @property
+    def first(self) -> str | None:
+        """The first fired condition, in the order the specs were given."""
+        return self.fired[0] if self.fired else None
+
+
+def gather(driver, conditions: dict[str, dict]) -> ConditionResult:
+    """Evaluate every condition in one script call, without waiting."""
+    fired, values = driver.execute_script(_CONDITIONS_SCRIPT, conditions)
+    return ConditionResult(tuple(fired), values)
+
+
+def _wait_conditions(driver, conditions, need_all, timeout, label):
+    def evaluate(d):
+        result = gather(d, conditions)
+        done = len(result.fired) == len(conditions) if need_all else result.fired
+        return result if done else False
 
+    return _until(driver, evaluate, timeout, label)
 
-def wait_visible(driver, locator, timeout=DEFAULT_TIMEOUT):
-    return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(locator))
 
+def wait_any(driver, conditions: dict[str, dict], timeout=None, label=None) -> ConditionResult:
+    """Wait until at least one named condition fires; one script call per poll.
 
-def wait_clickable(driver, locator, timeout=DEFAULT_TIMEOUT):
-    return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(locator))
+    ``wait_any(driver, {"error": Condition.visible(ERR), "ok": Condition.url_contains("/inventory")})``
+    """
+    return _wait_conditions(driver, conditions, False, timeout,
+                            label or f"any of {list(conditions)}")
 
 
-def wait_all_visible(driver, locator, timeout=DEFAULT_TIMEOUT):
-    return WebDriverWait(driver, timeout).until(EC.visibility_of_all_elements_located(locator))
+def wait_all(driver, conditions: dict[str, dict], timeout=None, label=None) -> ConditionResult:
+    """Wait until every named condition fires; one script call per poll."""
+    return _wait_conditions(driver, conditions, True, timeout,
+                            label or f"all of {list(conditions)}")
 
 
-def presence_located(driver, locator, timeout=DEFAULT_TIMEOUT):
-    return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
\ No newline at end of file
+def wait_until(driver, condition, timeout=None, label="condition"):
+    """Adaptive-polling replacement for ``WebDriverWait(driver, timeout).until(condition)``."""
+    return _until(driver, condition, timeout, label)
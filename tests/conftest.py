@@ -1,12 +1,30 @@
+import os
+from urllib.parse import urlparse
+
 import pytest
-from selenium import webdriver
-from src.config import BASE_URL, STANDARD_USER, STANDARD_PASSWORD
+from src.config import BASE_URL, STANDARD_USER
+from src.local_app.server import LocalAppServer
 from src.pages.cart_page import CartPage
 from src.pages.checkout_page import CheckoutPage
 from src.pages.inventory_page import InventoryPage
 from src.pages.login_page import LoginPage
 from src.pages.nav_page import NavPage
 from src.pages.pdp_page import PDPPage
+from src.utils.driver_factory import (
+    DEFAULT_BLOCKED_URLS,
+    GRID_POOL_SIZE,
+    PAGE_LOAD_STRATEGIES,
+    PROFILES,
+    SUPPORTED_BROWSERS,
+    block_urls,
+    create_driver,
+    create_remote_driver,
+    parse_capability,
+)
+from src.utils import waits
+from src.utils.artifacts import STORE as ARTIFACTS
+from src.utils.instrumentation import NO_TEST, CommandRecorder
+from src.utils.ordering import LOGGED_OUT, SessionTracker, count_transitions, reorder, required_state
 
 
 def pytest_addoption(parser):
@@ -16,80 +34,317 @@ def pytest_addoption(parser):
     parser.addoption(
         "--base-url", action="store", default=BASE_URL, help="Application base URL"
     )
+    parser.addoption(
+        "--local-app", action="store_true", default=False,
+        help="Run against the bundled SauceDemo stand-in on localhost (overrides --base-url)",
+    )
+    parser.addoption(
+        "--profile", action="store", default="full", choices=PROFILES,
+        help="Browser launch profile: full (visible, maximised), headless, "
+             "or lean (headless, no images/fonts/extensions/GPU, eager load, "
+             "third-party hosts blocked)",
+    )
+    parser.addoption(
+        "--page-load", action="store", default=None, choices=PAGE_LOAD_STRATEGIES,
+        help="Page load strategy: normal, eager or none (default: the profile's)",
+    )
+    parser.addoption(
+        "--timing-report", action="store", default=None, metavar="PATH",
+        help="Record every WebDriver command and write a per-test timing report (JSON) to PATH",
+    )
+    parser.addoption(
+        "--grid-url", action="store", default=os.getenv("GRID_URL"), metavar="URL",
+        help="Run on a Selenium Grid / remote WebDriver hub instead of a local browser",
+    )
+    parser.addoption(
+        "--grid-capability", action="append", default=[], metavar="KEY=VALUE",
+        help="Extra capability for --grid-url sessions (repeatable; JSON values are parsed)",
+    )
+    parser.addoption(
+        "--grid-pool-size", action="store", type=int, default=GRID_POOL_SIZE,
+        help=f"Keep-alive connections to the Grid hub (default: {GRID_POOL_SIZE})",
+    )
+    parser.addoption(
+        "--smart-order", action="store_true", default=False,
+        help="Reorder tests within each module/class by required start state and skip "
+             "logins and cart resets the browser state already satisfies",
+    )
+    parser.addoption(
+        "--wait-mode", action="store", default=waits.CONFIG.mode, choices=waits.WAIT_MODES,
+        help="Element waits: poll (WebDriver polling from Python) or observer "
+             "(in-page MutationObserver, one round-trip per wait)",
+    )
+    parser.addoption(
+        "--adaptive-waits", action="store_true", default=waits.CONFIG.adaptive_timeouts,
+        help="Give waits without an explicit timeout a per-locator timeout learned from "
+             "earlier waits this session (see WaitConfig.adaptive_timeouts)",
+    )
+
+
+# ------------------------------------------------------------------
+# WebDriver command timing (--timing-report)
+# ------------------------------------------------------------------
+
+command_recorder_key = pytest.StashKey[CommandRecorder]()
+session_tracker_key = pytest.StashKey[SessionTracker]()
+
+
+def pytest_configure(config):
+    waits.configure(
+        mode=config.getoption("wait_mode"),
+        adaptive_timeouts=config.getoption("adaptive_waits"),
+    )
+    if config.getoption("timing_report"):
+        config.stash[command_recorder_key] = CommandRecorder()
+    if config.getoption("smart_order"):
+        config.stash[session_tracker_key] = SessionTracker()
+
+
+def pytest_collection_modifyitems(config, items):
+    tracker = config.stash.get(session_tracker_key, None)
+    if tracker is None:
+        return
+    tracker.transitions_before = count_transitions(items)
+    items[:] = reorder(items)
+    tracker.transitions_after = count_transitions(items)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    recorder = item.config.stash.get(command_recorder_key, None)
+    if recorder is not None:
+        recorder.current_test = item.nodeid
+    ARTIFACTS.current_test = item.nodeid
+    yield
+    if recorder is not None:
+        recorder.current_test = NO_TEST
+    ARTIFACTS.current_test = NO_TEST
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    driver = item.funcargs.get("driver") if hasattr(item, "funcargs") else None
+    if report.when == "call" and report.failed and driver is not None:
+        ARTIFACTS.capture(driver, "test_failure")
+
+
+def pytest_sessionfinish(session):
+    ARTIFACTS.close()
+
+    recorder = session.config.stash.get(command_recorder_key, None)
+    if recorder is None or not recorder.commands:
+        return
+
+    path = session.config.getoption("timing_report")
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{worker}{ext}"
+    recorder.write_report(path)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    tracker = config.stash.get(session_tracker_key, None)
+    if tracker is not None:
+        terminalreporter.section("Smart ordering")
+        terminalreporter.write_line(tracker.summary())
+
+    recorder = config.stash.get(command_recorder_key, None)
+    if recorder is None or not recorder.commands:
+        return
+
+    summary = recorder.report(top=5)["summary"]
+    terminalreporter.section("WebDriver timing")
+    terminalreporter.write_line(
+        f"{summary['command_count']} commands, {summary['navigations']} navigations, "
+        f"{summary['wire_time']:.2f}s on the wire, {summary['wait_time']:.2f}s in waits"
+    )
+    for call in summary["top_slow_calls"]:
+        terminalreporter.write_line(
+            f"  {call['duration'] * 1000:8.1f} ms  {call['command']:<24} "
+            f"{call['page_method'] or '<test>'}  ({call['test']})"
+        )
 
 
 @pytest.fixture(scope="session")
-def base_url(pytestconfig):
+def local_app(pytestconfig):
+    """Serve the local SauceDemo stand-in for the session when --local-app is set."""
+    if not pytestconfig.getoption("local_app"):
+        yield None
+        return
+
+    server = LocalAppServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(pytestconfig, local_app):
+    if local_app:
+        return local_app.url
     return pytestconfig.getoption("base_url")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def driver(pytestconfig, base_url):
-    browser_name = pytestconfig.getoption("browser").lower()
+    """One browser for the whole session, per process.
 
-    if browser_name == "chrome":
-        _driver = webdriver.Chrome()
-    elif browser_name == "edge":
-        _driver = webdriver.Edge()
-    else:
+    The browser is reused across modules; ``fresh_module_state`` and the login
+    fixtures reset cookies and storage instead of relaunching it.
+
+    Under pytest-xdist (``-n N``) every worker process builds its own driver, so
+    cookies and localStorage — and with them the login and cart state used by
+    ``app_login`` and ``clean_cart`` — never leak between workers.
+    """
+    browser_name = pytestconfig.getoption("browser").lower()
+    if browser_name not in SUPPORTED_BROWSERS:
         raise pytest.UsageError(
             f"--browser '{browser_name}' is not supported. Use 'chrome' or 'edge'."
         )
 
-    _driver.maximize_window()
+    launch = {
+        "profile": pytestconfig.getoption("profile"),
+        "app_host": urlparse(base_url).hostname,
+        "page_load_strategy": pytestconfig.getoption("page_load"),
+    }
+    grid_url = pytestconfig.getoption("grid_url")
+    if grid_url:
+        try:
+            capabilities = dict(
+                parse_capability(spec) for spec in pytestconfig.getoption("grid_capability")
+            )
+        except ValueError as e:
+            raise pytest.UsageError(f"--grid-capability: {e}")
+        _driver = create_remote_driver(
+            grid_url,
+            browser_name,
+            capabilities=capabilities,
+            pool_size=pytestconfig.getoption("grid_pool_size"),
+            **launch,
+        )
+    else:
+        _driver = create_driver(browser_name, **launch)
+    recorder = pytestconfig.stash.get(command_recorder_key, None)
+    if recorder is not None:
+        recorder.install(_driver)
     _driver.get(base_url)
 
     yield _driver
     _driver.quit()
 
 
+@pytest.fixture(autouse=True)
+def blocked_urls(request, driver):
+    """Drop trackers and media for tests marked ``block_urls``.
+
+    ``@pytest.mark.block_urls`` uses the default tracker + media blocklist;
+    ``@pytest.mark.block_urls("*.png", ...)`` blocks only the given patterns.
+    The markers are module-level, so the blocklist stays in force across a
+    module: ``block_urls`` only talks to DevTools when the set differs from
+    the previous test's (first test of a marked module, first unmarked test
+    after it).
+    """
+    marker = request.node.get_closest_marker("block_urls")
+    block_urls(driver, (marker.args or DEFAULT_BLOCKED_URLS) if marker else ())
+
+
 # ------------------------------------------------------------------
 # Page object fixtures
 # ------------------------------------------------------------------
 
-@pytest.fixture(scope="module")
-def login_page(driver):
-    return LoginPage(driver)
+@pytest.fixture(scope="session")
+def login_page(driver, base_url):
+    return LoginPage(driver, base_url)
 
 
-@pytest.fixture(scope="module")
-def inventory_page(driver):
-    return InventoryPage(driver)
+@pytest.fixture(scope="session")
+def inventory_page(driver, base_url):
+    return InventoryPage(driver, base_url)
 
 
-@pytest.fixture(scope="module")
-def cart_page(driver):
-    return CartPage(driver)
+@pytest.fixture(scope="session")
+def cart_page(driver, base_url):
+    return CartPage(driver, base_url)
+
+
+@pytest.fixture(scope="session")
+def pdp_page(driver, base_url):
+    return PDPPage(driver, base_url)
+
+
+@pytest.fixture(scope="session")
+def checkout_page(driver, base_url):
+    return CheckoutPage(driver, base_url)
+
+
+@pytest.fixture(scope="session")
+def nav_page(driver, base_url):
+    return NavPage(driver, base_url)
 
 
-@pytest.fixture(scope="module")
-def pdp_page(driver):
-    return PDPPage(driver)
+# ------------------------------------------------------------------
+# State fixtures
+# ------------------------------------------------------------------
 
+@pytest.fixture(scope="session")
+def session_tracker(pytestconfig):
+    """The ``--smart-order`` state tracker, or None when smart ordering is off."""
+    return pytestconfig.stash.get(session_tracker_key, None)
 
-@pytest.fixture(scope="module")
-def checkout_page(driver):
-    return CheckoutPage(driver)
 
+@pytest.fixture(scope="module", autouse=True)
+def fresh_module_state(login_page, session_tracker):
+    """Start every module logged out on the login page, as a new browser would."""
+    login_page.end_session()
+    if session_tracker is not None:
+        session_tracker.user = None
 
-@pytest.fixture(scope="module")
-def nav_page(driver):
-    return NavPage(driver)
+
+@pytest.fixture(autouse=True)
+def logged_out_start(request, login_page, session_tracker):
+    """Under --smart-order, log out before a logged-out test if a fixture left a session behind."""
+    if session_tracker is None or session_tracker.user is None:
+        return
+    if required_state(request.node).auth == LOGGED_OUT:
+        login_page.end_session()
+        session_tracker.user = None
+        session_tracker.logouts += 1
 
 
 @pytest.fixture(scope="function")
-def app_login(login_page):
-    """Log in before a test and log out cleanly after."""
-    login_page.login(username=STANDARD_USER, password=STANDARD_PASSWORD)
-    yield
-    login_page.log_out()
+def app_login(login_page, session_tracker):
+    """Start the test logged in on the inventory page and log out cleanly after.
+
+    Under --smart-order there is no teardown: the session (and whatever the test
+    left in the cart or on screen) is kept after the test. The next test that
+    needs it reuses it only when ``session_is_fresh`` confirms the browser still
+    looks freshly logged in, and logs in again otherwise. The next logged-out
+    test is logged out by ``logged_out_start``, and the next module by
+    ``fresh_module_state``.
+    """
+    if session_tracker is None:
+        assert login_page.login_with_session(STANDARD_USER), "cookie login failed"
+        yield
+        login_page.end_session()
+        return
+
+    if session_tracker.user == STANDARD_USER and login_page.session_is_fresh(STANDARD_USER):
+        session_tracker.logins_skipped += 1
+    else:
+        assert login_page.login_with_session(STANDARD_USER), "cookie login failed"
+        session_tracker.logins_run += 1
+    session_tracker.user = STANDARD_USER
+    yield  # no teardown under --smart-order; see docstring
 
 
 @pytest.fixture(scope="function")
-def clean_cart(cart_page, app_login):
-    """Log in and guarantee an empty cart before and after the test."""
-    cart_page.go_to_cart()
-    cart_page.clear_cart()
-    yield
-    cart_page.go_to_cart()
-    cart_page.clear_cart()
\ No newline at end of file
+def clean_cart(app_login):
+    """Log in and guarantee an empty cart before and after the test.
+
+    ``app_login`` handles the reset both ways: ``login_with_session`` clears
+    storage on setup and ``end_session`` clears it again on teardown. Under
+    --smart-order the next test's ``session_is_fresh`` check rejects a session
+    with anything left in the cart.
+    """
@@ -1,5 +1,7 @@
 import pytest
 
+pytestmark = pytest.mark.block_urls
+
 
 class TestCart:
 
@@ -48,9 +50,7 @@ class TestCart:
     def test_cart_003(self, inventory_page, cart_page, clean_cart):
         """Validate an item can be removed from the cart."""
         inventory_page.open()
-        inventory_page.add_item_to_cart(self.ITEMS[0])
-        inventory_page.add_item_to_cart(self.ITEMS[2])
-        inventory_page.add_item_to_cart(self.ITEMS[4])
+        inventory_page.add_items_to_cart([self.ITEMS[0], self.ITEMS[2], self.ITEMS[4]])
 
         cart_page.go_to_cart()
 
@@ -64,9 +64,7 @@ class TestCart:
     def test_cart_004(self, inventory_page, cart_page, clean_cart):
         """Validate cart items are preserved after navigating away and back."""
         inventory_page.open()
-        inventory_page.add_item_to_cart(self.ITEMS[0])
-        inventory_page.add_item_to_cart(self.ITEMS[2])
-        inventory_page.add_item_to_cart(self.ITEMS[4])
+        inventory_page.add_items_to_cart([self.ITEMS[0], self.ITEMS[2], self.ITEMS[4]])
 
         cart_page.go_to_cart()
         items_before = cart_page.get_cart_item_names()
@@ -83,9 +81,7 @@ class TestCart:
     def test_cart_005(self, inventory_page, cart_page, clean_cart):
         """Validate cart items are preserved after a page refresh."""
         inventory_page.open()
-        inventory_page.add_item_to_cart(self.ITEMS[0])
-        inventory_page.add_item_to_cart(self.ITEMS[2])
-        inventory_page.add_item_to_cart(self.ITEMS[4])
+        inventory_page.add_items_to_cart([self.ITEMS[0], self.ITEMS[2], self.ITEMS[4]])
 
         cart_page.go_to_cart()
         items_before = cart_page.get_cart_item_names()
@@ -112,8 +108,7 @@ class TestCart:
         inventory_page.open()
         items_to_add = [self.ITEMS[0], self.ITEMS[1], self.ITEMS[2]]
 
-        for item in items_to_add:
-            inventory_page.add_item_to_cart(item)
+        inventory_page.add_items_to_cart(items_to_add)
 
         cart_page.go_to_cart()
 
@@ -128,4 +123,39 @@ class TestCart:
         cart_page.click_continue_shopping()
 
         assert inventory_page.get_product_title() == "Products", \
-            "Continue Shopping did not navigate to the inventory page."
\ No newline at end of file
+            "Continue Shopping did not navigate to the inventory page."
+
+    @pytest.mark.regression
+    @pytest.mark.cart
+    def test_cart_009(self, inventory_page, cart_page, clean_cart):
+        """Validate several items can be added and removed in one batch, with per-item results."""
+        inventory_page.open()
+        added = inventory_page.add_items_to_cart([self.ITEMS[0], self.ITEMS[1], self.ITEMS[3]])
+        assert all(added.values()), f"Bulk add failed for: {[n for n, ok in added.items() if not ok]}"
+
+        cart_page.go_to_cart()
+        removed = cart_page.remove_items([self.ITEMS[0], self.ITEMS[3], self.ITEMS[2]])
+
+        assert removed == {self.ITEMS[0]: True, self.ITEMS[3]: True, self.ITEMS[2]: False}, \
+            f"Unexpected bulk remove result: {removed}"
+        assert cart_page.get_cart_item_count() == 1, \
+            f"Expected 1 item left in cart, got {cart_page.get_cart_item_count()}."
+
+    @pytest.mark.regression
+    @pytest.mark.cart
+    def test_cart_010(self, inventory_page, cart_page, clean_cart):
+        """Validate clear_cart empties the cart from the cart page and is a no-op elsewhere."""
+        inventory_page.open()
+        inventory_page.add_items_to_cart([self.ITEMS[0], self.ITEMS[1], self.ITEMS[3]])
+
+        assert cart_page.clear_cart(), "clear_cart should return at once off the cart page."
+        assert len(cart_page.get_cart_contents()) == 3, \
+            "clear_cart changed the cart while off the cart page."
+
+        cart_page.go_to_cart()
+
+        assert cart_page.clear_cart(), "clear_cart did not report an empty cart."
+        assert cart_page.get_cart_item_count() == 0, \
+            f"Expected an empty cart, got {cart_page.get_cart_item_count()} items."
+        assert cart_page.get_cart_badge_count() == 0, "Cart badge still shown after clear_cart."
+        assert cart_page.get_cart_contents() == [], "Cart storage not emptied by clear_cart."
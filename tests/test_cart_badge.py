@@ -46,8 +46,7 @@ class TestCartBadge:
         tile_price_a = inventory_page.get_item_price(self.ITEM_A)
         tile_price_b = inventory_page.get_item_price(self.ITEM_B)
 
-        inventory_page.add_item_to_cart(self.ITEM_A)
-        inventory_page.add_item_to_cart(self.ITEM_B)
+        inventory_page.add_items_to_cart([self.ITEM_A, self.ITEM_B])
 
         inventory_page.click_cart()
 
@@ -71,8 +70,7 @@ class TestCartBadge:
     ):
         """Removing an item from the cart updates the badge and resets the inventory tile button."""
         inventory_page.open()
-        inventory_page.add_item_to_cart(self.ITEM_A)
-        inventory_page.add_item_to_cart(self.ITEM_B)
+        inventory_page.add_items_to_cart([self.ITEM_A, self.ITEM_B])
 
         assert inventory_page.get_cart_badge_count() == 2
 
@@ -94,8 +92,7 @@ class TestCartBadge:
     def test_cart_004_badge_persists_after_refresh(self, inventory_page, clean_cart):
         """Cart badge count is maintained after refreshing the inventory page."""
         inventory_page.open()
-        inventory_page.add_item_to_cart(self.ITEM_A)
-        inventory_page.add_item_to_cart(self.ITEM_B)
+        inventory_page.add_items_to_cart([self.ITEM_A, self.ITEM_B])
 
         badge_before = inventory_page.get_cart_badge_count()
 
@@ -137,8 +134,7 @@ class TestCartBadge:
         """Cart contents survive a full inventory → PDP → cart → back loop."""
         # Step 1: add two items from inventory
         inventory_page.open()
-        inventory_page.add_item_to_cart(self.ITEM_A)
-        inventory_page.add_item_to_cart(self.ITEM_B)
+        inventory_page.add_items_to_cart([self.ITEM_A, self.ITEM_B])
         items_added = {self.ITEM_A, self.ITEM_B}
 
         # Step 2: visit PDP of one item
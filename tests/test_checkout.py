@@ -1,6 +1,6 @@
 import pytest
 
-pytestmark = pytest.mark.regression
+pytestmark = [pytest.mark.regression, pytest.mark.block_urls]
 
 # Standard checkout info used across tests
 FIRST_NAME  = "John"
@@ -13,12 +13,12 @@ class TestCheckout:
 
     ITEM_A = "Sauce Labs Bike Light"
     ITEM_B = "Sauce Labs Bolt T-Shirt"
+    ITEM_ID_A = 0    # Bike Light
+    ITEM_ID_B = 1    # Bolt T-Shirt
 
-    def _add_items_and_go_to_cart(self, inventory_page, cart_page):
-        """Helper: add two standard items then navigate to cart."""
-        inventory_page.open()
-        inventory_page.add_item_to_cart(self.ITEM_A)
-        inventory_page.add_item_to_cart(self.ITEM_B)
+    def _add_items_and_go_to_cart(self, cart_page):
+        """Helper: seed the cart with two standard items then navigate to cart."""
+        cart_page.set_cart_contents([self.ITEM_ID_A, self.ITEM_ID_B])
         cart_page.go_to_cart()
 
 
@@ -29,7 +29,7 @@ class TestCheckout:
         self, inventory_page, cart_page, checkout_page, clean_cart
     ):
         """Attempting to continue with all fields empty shows a validation error."""
-        self._add_items_and_go_to_cart(inventory_page, cart_page)
+        self._add_items_and_go_to_cart(cart_page)
         cart_page.checkout()
 
         assert checkout_page.is_on_step_one(), "Did not reach checkout step one."
@@ -48,23 +48,22 @@ class TestCheckout:
         self, inventory_page, cart_page, checkout_page, clean_cart
     ):
         """Completing Step One reaches the Overview page with subtotal, tax and total visible."""
-        self._add_items_and_go_to_cart(inventory_page, cart_page)
+        self._add_items_and_go_to_cart(cart_page)
         cart_page.checkout()
 
         checkout_page.fill_checkout_info(FIRST_NAME, LAST_NAME, POSTAL_CODE)
         checkout_page.click_continue()
 
+        checkout_page.assert_absent(*checkout_page.ERROR_MESSAGE)
         assert checkout_page.is_on_overview(), "Did not reach checkout overview."
         assert checkout_page.get_overview_title() == "Checkout: Overview", \
             "Overview page title is incorrect."
 
-        subtotal = checkout_page.get_subtotal()
-        tax = checkout_page.get_tax()
-        total = checkout_page.get_total()
+        overview = checkout_page.read_overview()
 
-        assert subtotal > 0, "Subtotal should be greater than 0."
-        assert tax >= 0, "Tax should be non-negative."
-        assert total > 0, "Total should be greater than 0."
+        assert overview.subtotal > 0, "Subtotal should be greater than 0."
+        assert overview.tax >= 0, "Tax should be non-negative."
+        assert overview.total > 0, "Total should be greater than 0."
 
 
     @pytest.mark.smoke
@@ -73,7 +72,7 @@ class TestCheckout:
         self, inventory_page, cart_page, checkout_page, clean_cart
     ):
         """Finishing checkout shows confirmation page; Back Home returns to inventory with empty cart."""
-        self._add_items_and_go_to_cart(inventory_page, cart_page)
+        self._add_items_and_go_to_cart(cart_page)
         cart_page.checkout()
 
         checkout_page.fill_checkout_info(FIRST_NAME, LAST_NAME, POSTAL_CODE)
@@ -98,7 +97,7 @@ class TestCheckout:
         self, inventory_page, cart_page, checkout_page, clean_cart
     ):
         """Cancelling from the Overview page returns to cart with items still present."""
-        self._add_items_and_go_to_cart(inventory_page, cart_page)
+        self._add_items_and_go_to_cart(cart_page)
         items_before = cart_page.get_cart_item_names()
 
         cart_page.checkout()
@@ -122,33 +121,31 @@ class TestCheckout:
         self, inventory_page, cart_page, checkout_page, clean_cart
     ):
         """Subtotal on the Overview page equals the sum of individual item prices; total = subtotal + tax."""
-        self._add_items_and_go_to_cart(inventory_page, cart_page)
+        self._add_items_and_go_to_cart(cart_page)
 
-        # Capture individual prices from cart before proceeding
-        item_prices = cart_page.get_cart_item_prices_float()
-        expected_subtotal = round(sum(item_prices), 2)
+        # Capture the cart contents before proceeding
+        cart_names = cart_page.get_cart_item_names()
+        cart_prices = cart_page.get_cart_item_prices_decimal()
 
         cart_page.checkout()
         checkout_page.fill_checkout_info(FIRST_NAME, LAST_NAME, POSTAL_CODE)
         checkout_page.click_continue()
 
-        actual_subtotal = checkout_page.get_subtotal()
-        actual_tax = checkout_page.get_tax()
-        actual_total = checkout_page.get_total()
+        overview = checkout_page.read_overview()
 
-        assert actual_subtotal == expected_subtotal, \
-            f"Subtotal mismatch — expected ${expected_subtotal}, got ${actual_subtotal}."
-
-        expected_total = round(actual_subtotal + actual_tax, 2)
-        assert actual_total == expected_total, \
-            f"Total mismatch — expected ${expected_total} (subtotal + tax), got ${actual_total}."
+        assert [line.name for line in overview.items] == cart_names, \
+            f"Overview items differ from the cart.\nCart: {cart_names}\nOverview: {overview.items}"
+        assert [line.price for line in overview.items] == cart_prices, \
+            f"Overview prices differ from the cart.\nCart: {cart_prices}\nOverview: {overview.items}"
+        assert overview.consistent, \
+            "Overview totals are inconsistent: " + "; ".join(overview.problems)
 
     @pytest.mark.checkout
     def test_chk_006_inventory_buttons_reset_after_checkout(
         self, inventory_page, cart_page, checkout_page, clean_cart
     ):
         """After completing checkout, all inventory tile buttons read 'Add to cart'."""
-        self._add_items_and_go_to_cart(inventory_page, cart_page)
+        self._add_items_and_go_to_cart(cart_page)
         cart_page.checkout()
 
         checkout_page.fill_checkout_info(FIRST_NAME, LAST_NAME, POSTAL_CODE)
@@ -30,8 +30,11 @@ class TestInventoryUI:
             "One or more products have an invalid or missing name."
         assert inventory_page.all_products_have_prices(), \
             "One or more products have an invalid or missing price."
-        assert inventory_page.add_to_cart_button_toggle_works(), \
-            "Add to cart button toggle failed for one or more products."
+
+        toggle_report = inventory_page.toggle_sweep()
+        failed = [f"{result.name}: {result.error}" for result in toggle_report if not result.ok]
+        assert toggle_report and not failed, \
+            f"Add to cart button toggle failed for one or more products: {failed}"
 
     @pytest.mark.smoke
     @pytest.mark.regression
@@ -61,37 +64,70 @@ class TestInventoryUI:
     @pytest.mark.sorting
     def test_inv_005_sort_name_asc(self, inventory_page, app_login):
         """Validate Name (A to Z) filter sorts products alphabetically ascending."""
-        inventory_page.apply_filter("a_z")
-        names = inventory_page.get_product_names()
-        assert names == sorted(names), \
-            f"Products not sorted A→Z. Got: {names}"
+        check = inventory_page.verify_sort("a_z")
+        assert check.ok, \
+            f"Products not sorted A→Z. First violation: {check.violation}. Got: {check.values}"
 
     @pytest.mark.regression
     @pytest.mark.ui
     @pytest.mark.sorting
     def test_inv_006_sort_name_desc(self, inventory_page, app_login):
         """Validate Name (Z to A) filter sorts products alphabetically descending."""
-        inventory_page.apply_filter("z_a")
-        names = inventory_page.get_product_names()
-        assert names == sorted(names, reverse=True), \
-            f"Products not sorted Z→A. Got: {names}"
+        check = inventory_page.verify_sort("z_a")
+        assert check.ok, \
+            f"Products not sorted Z→A. First violation: {check.violation}. Got: {check.values}"
 
     @pytest.mark.regression
     @pytest.mark.ui
     @pytest.mark.sorting
     def test_inv_007_sort_price_asc(self, inventory_page, app_login):
         """Validate Price (low to high) filter sorts products by price ascending."""
-        inventory_page.apply_filter("l_h")
-        prices = inventory_page.get_product_prices()
-        assert prices == sorted(prices), \
-            f"Products not sorted low→high. Got: {prices}"
+        check = inventory_page.verify_sort("l_h")
+        assert check.ok, \
+            f"Products not sorted low→high. First violation: {check.violation}. Got: {check.values}"
 
     @pytest.mark.regression
     @pytest.mark.ui
     @pytest.mark.sorting
     def test_inv_008_sort_price_desc(self, inventory_page, app_login):
         """Validate Price (high to low) filter sorts products by price descending."""
-        inventory_page.apply_filter("h_l")
-        prices = inventory_page.get_product_prices()
-        assert prices == sorted(prices, reverse=True), \
-            f"Products not sorted high→low. Got: {prices}"
\ No newline at end of file
+        check = inventory_page.verify_sort("h_l")
+        assert check.ok, \
+            f"Products not sorted high→low. First violation: {check.violation}. Got: {check.values}"
+
+    @pytest.mark.regression
+    @pytest.mark.ui
+    def test_inv_009_chunked_iteration_and_lookup_by_id(self, inventory_page, clean_cart):
+        """Validate chunked tile iteration matches the full snapshot and products resolve by id."""
+        inventory_page.open()
+        snapshot = inventory_page.get_inventory_snapshot()
+        streamed = tuple(inventory_page.iter_inventory(chunk_size=4))
+        assert streamed == snapshot, \
+            "Chunked iteration did not return the same tiles as the full snapshot."
+
+        ids = [item.product_id for item in snapshot]
+        assert None not in ids and len(set(ids)) == len(ids), \
+            f"Every tile should expose a unique product id. Got: {ids}"
+
+        target = snapshot[-1]
+        assert inventory_page.add_item_to_cart_by_id(target.product_id), \
+            f"Failed to add product id {target.product_id} to cart."
+        assert inventory_page.get_item_button_text(target.name) == "Remove", \
+            f"Tile for '{target.name}' should read 'Remove' after adding by id."
+        assert not inventory_page.add_item_to_cart_by_id(999), \
+            "Adding an unknown product id should report False."
+
+    @pytest.mark.regression
+    @pytest.mark.ui
+    @pytest.mark.sorting
+    def test_inv_010_all_sorts_in_one_page_load(self, inventory_page, app_login):
+        """Validate every filter order on a single page load and that the original filter is restored."""
+        before = inventory_page.current_filter()
+        checks = inventory_page.verify_all_sorts()
+
+        assert set(checks) == set(inventory_page.FILTER_MAP), \
+            f"Expected a check per filter, got: {list(checks)}"
+        failed = {key: check.violation for key, check in checks.items() if not check.ok}
+        assert not failed, f"Sort order violated (key: (index, previous, value)): {failed}"
+        assert inventory_page.current_filter() == before, \
+            "verify_all_sorts should restore the filter that was selected before."
@@ -13,6 +13,7 @@ class TestLogin:
         """Login with valid credentials and verify landing on inventory page."""
         assert login_page.login(STANDARD_USER, STANDARD_PASSWORD), \
             f"Login failed for user: {STANDARD_USER}"
+        login_page.assert_absent(*login_page.ERROR_MESSAGE)
         assert inventory_page.get_page_logo_text() == "Swag Labs", \
             "App logo text missing or did not match after login."
 
@@ -32,7 +33,7 @@ class TestLogin:
     def test_auth_003(self, login_page):
         """Bypass login by navigating directly to inventory URL — expect error."""
         login_page.log_out()
-        login_page.navigate_url("https://www.saucedemo.com/inventory.html")
+        login_page.navigate_url(f"{login_page.base_url}/inventory.html")
 
         assert login_page.get_error_message() == \
             "Epic sadface: You can only access '/inventory.html' when you are logged in."
@@ -57,7 +58,7 @@ class TestLogin:
     def test_auth_006(self, login_page):
         """Login with empty username and password — validate error message."""
         login_page.log_out()
-        login_page.navigate_url(login_page.LOGIN_URL)
+        login_page.navigate_url(login_page.login_url)
         result = login_page.login("", "")
 
         assert result is False, "login() should return False for empty credentials"
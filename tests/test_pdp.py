@@ -132,5 +132,5 @@ class TestPDP:
         assert "404" not in page_source, "App returned a 404 for an invalid product ID."
         assert "error" not in pdp_page.driver.title.lower(), \
             "Browser tab title indicates an error for an invalid product ID."
-        assert "saucedemo.com" in current_url, \
+        assert current_url.startswith(pdp_page.base_url), \
             "App navigated away from SauceDemo domain on invalid product ID."
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""Browser-free unit tests.
+
+The parent conftest's autouse fixtures drive a real browser; they are
+overridden here with no-ops so these tests run without one.
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def blocked_urls():
+    yield
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fresh_module_state():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def logged_out_start():
+    yield
@@ -0,0 +1,152 @@
+import base64
+import json
+import os
+
+from src.utils.artifacts import ArtifactStore
+
+
+class FakeDriver:
+    """Serves a fixed screenshot and DOM; has no browser log."""
+
+    def __init__(self, png=b"frame-a", html="<html></html>"):
+        self.png = png
+        self.html = html
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(self.png).decode("ascii")
+
+    def execute_script(self, script):
+        return ["http://app.test/page", self.html]
+
+
+def capture(store, driver, label):
+    bundle = store.capture(driver, label)
+    store.flush()
+    return bundle
+
+
+def meta(bundle):
+    with open(os.path.join(bundle, "meta.json"), encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def on_disk(root):
+    return sorted(
+        os.path.relpath(os.path.join(directory, name), root)
+        for directory, _dirs, names in os.walk(root) for name in names
+    )
+
+
+class TestDedupe:
+
+    def test_identical_frames_are_stored_once(self, tmp_path):
+        store = ArtifactStore(root=str(tmp_path), workers=1)
+        first = capture(store, FakeDriver(), "one")
+        second = capture(store, FakeDriver(), "two")
+
+        assert os.path.exists(os.path.join(first, "screenshot.png"))
+        assert not os.path.exists(os.path.join(second, "screenshot.png"))
+        assert meta(second)["screenshot"] == meta(first)["screenshot"]
+        assert meta(second)["sha1"] == meta(first)["sha1"]
+
+    def test_different_frames_are_stored_separately(self, tmp_path):
+        store = ArtifactStore(root=str(tmp_path), workers=1)
+        first = capture(store, FakeDriver(b"frame-a"), "one")
+        second = capture(store, FakeDriver(b"frame-b"), "two")
+
+        assert meta(first)["screenshot"].startswith(first)
+        assert meta(second)["screenshot"].startswith(second)
+
+    def test_frames_from_earlier_runs_are_reused(self, tmp_path):
+        first = capture(ArtifactStore(root=str(tmp_path), workers=1), FakeDriver(), "one")
+        second = capture(ArtifactStore(root=str(tmp_path), workers=1), FakeDriver(), "two")
+
+        assert meta(second)["screenshot"] == os.path.join(first, "screenshot.png")
+
+
+class TestEviction:
+
+    def test_total_is_not_double_counted_on_rewrite(self, tmp_path):
+        store = ArtifactStore(root=str(tmp_path), workers=1)
+        bundle = capture(store, FakeDriver(), "one")
+        path = os.path.join(bundle, "meta.json")
+        old_size = store._files[path]
+        before = store._total
+
+        store._store(path, b"{}")
+
+        assert store._total == before - old_size + 2
+        assert store._total == sum(os.path.getsize(tmp_path / f) for f in on_disk(tmp_path))
+
+    def test_oldest_bundles_are_evicted_whole(self, tmp_path):
+        store = ArtifactStore(root=str(tmp_path), workers=1)
+        bundles = [capture(store, FakeDriver(b"frame-%d" % i, "x" * 400), f"b{i}") for i in range(3)]
+        one_bundle = store._total // 3
+
+        store.max_bytes = one_bundle * 2
+        capture(store, FakeDriver(b"frame-3", "x" * 400), "b3")
+
+        assert not os.path.exists(bundles[0])
+        assert not os.path.exists(bundles[1])
+        assert os.path.exists(bundles[2])
+        assert store._total <= store.max_bytes
+
+    def test_shared_frame_is_kept_while_referenced(self, tmp_path):
+        store = ArtifactStore(root=str(tmp_path), workers=1)
+        owner = capture(store, FakeDriver(b"shared", "x" * 400), "owner")
+        user = capture(store, FakeDriver(b"shared", "x" * 400), "user")
+        frame = meta(user)["screenshot"]
+
+        store.max_bytes = store._total - 1
+        store._evict()
+
+        assert not os.path.exists(os.path.join(owner, "meta.json"))
+        assert os.path.exists(frame), "frame still referenced by another bundle was deleted"
+
+        store.max_bytes = 0
+        store._bundles[os.path.join(str(tmp_path), "newer")] = None
+        store._evict()
+
+        assert not os.path.exists(frame)
+
+    def test_files_the_store_did_not_write_are_left_alone(self, tmp_path):
+        legacy = tmp_path / "fail_test_login.png"
+        legacy.write_bytes(b"x" * 5000)
+        stray = tmp_path / "notes" / "readme.txt"
+        stray.parent.mkdir()
+        stray.write_bytes(b"x" * 5000)
+        other_worker = tmp_path / "gw0" / "test_a" / "bundle"
+        other_worker.mkdir(parents=True)
+        (other_worker / "meta.json").write_text("{}")
+
+        store = ArtifactStore(root=str(tmp_path), max_bytes=0, workers=1)
+        capture(store, FakeDriver(b"frame-a"), "one")
+        capture(store, FakeDriver(b"frame-b"), "two")
+
+        assert legacy.exists()
+        assert stray.exists()
+        assert (other_worker / "meta.json").exists()
+        assert tmp_path.exists()
+        assert store._total == sum(store._files.values())
+
+    def test_bundles_from_earlier_runs_are_evicted(self, tmp_path):
+        old = capture(ArtifactStore(root=str(tmp_path), workers=1), FakeDriver(b"frame-a", "x" * 400), "old")
+
+        store = ArtifactStore(root=str(tmp_path), max_bytes=1, workers=1)
+        capture(store, FakeDriver(b"frame-b", "x" * 400), "new")
+
+        assert not os.path.exists(old)
+
+
+class TestFlush:
+
+    def test_failed_write_is_logged_not_raised(self, tmp_path, caplog):
+        blocker = tmp_path / "blocked"
+        blocker.write_text("not a directory")
+        store = ArtifactStore(root=str(blocker), workers=1)
+
+        store.capture(FakeDriver(), "one")
+        store.close()
+
+        assert len(store.errors) == 1
+        assert "Failed to write failure artifact" in caplog.text
@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+
+from src.pages.checkout_page import Overview, OverviewLine, _money
+
+
+def overview(prices, subtotal, tax, total, quantities=None):
+    quantities = quantities or [1] * len(prices)
+    items = tuple(
+        OverviewLine(f"item {i}", Decimal(price), quantity)
+        for i, (price, quantity) in enumerate(zip(prices, quantities))
+    )
+    return Overview(items, Decimal(subtotal), Decimal(tax), Decimal(total))
+
+
+class TestMoney:
+
+    @pytest.mark.parametrize("text, expected", [
+        ("Item total: $29.99", "29.99"),
+        ("Tax: $2.40", "2.40"),
+        ("Total: $1,029.99", "1029.99"),
+        ("$7", "7"),
+        ("$ 15.99", "15.99"),
+    ])
+    def test_parses_dollar_amounts(self, text, expected):
+        assert _money(text) == Decimal(expected)
+
+    def test_keeps_exact_cents(self):
+        assert _money("$0.10") + _money("$0.20") == Decimal("0.30")
+
+    @pytest.mark.parametrize("text", ["", "Total:", "Total: 29.99", "$", "$abc", "$1.2.3", "$.99"])
+    def test_rejects_malformed_amounts(self, text):
+        with pytest.raises(ValueError):
+            _money(text)
+
+
+class TestOverviewConsistency:
+
+    def test_consistent_overview_has_no_problems(self):
+        o = overview(["9.99", "15.99"], "25.98", "2.08", "28.06")
+        assert o.item_sum == Decimal("25.98")
+        assert o.problems == []
+        assert o.consistent
+
+    def test_quantities_count_toward_item_sum(self):
+        o = overview(["9.99", "15.99"], "35.97", "0", "35.97", quantities=[2, 1])
+        assert o.consistent
+
+    def test_subtotal_mismatch_is_reported(self):
+        o = overview(["9.99", "15.99"], "25.99", "2.08", "28.07")
+        assert not o.consistent
+        assert o.problems == ["items sum to $25.98, subtotal shows $25.99"]
+
+    def test_total_mismatch_is_reported(self):
+        o = overview(["9.99"], "9.99", "0.80", "10.80")
+        assert o.problems == ["subtotal $9.99 + tax $0.80 = $10.79, total shows $10.80"]
+
+    def test_both_mismatches_are_reported(self):
+        o = overview(["9.99"], "10.00", "0.80", "11.00")
+        assert len(o.problems) == 2
+
+    def test_float_rounding_does_not_cause_false_mismatch(self):
+        # 0.1 + 0.2 != 0.3 in binary floating point; Decimal sums exactly
+        o = overview(["0.10", "0.20"], "0.30", "0.00", "0.30")
+        assert o.consistent
+
+    def test_empty_overview_is_consistent_at_zero(self):
+        assert overview([], "0", "0", "0").consistent
@@ -0,0 +1,136 @@
+import pytest
+
+from src.utils import driver_factory
+from src.utils.driver_factory import (
+    DEFAULT_BLOCKED_URLS,
+    GRID_POOL_SIZE,
+    block_urls,
+    create_remote_driver,
+    parse_capability,
+)
+
+
+class FakeCdpDriver:
+    """Records DevTools commands."""
+
+    def __init__(self):
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+        return {}
+
+
+class TestBlockUrls:
+
+    def test_first_block_enables_network_and_sets_patterns(self):
+        driver = FakeCdpDriver()
+
+        assert block_urls(driver, ["*.png"])
+
+        assert driver.cdp == [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": ["*.png"]})]
+
+    def test_same_set_sends_nothing(self):
+        driver = FakeCdpDriver()
+        block_urls(driver, DEFAULT_BLOCKED_URLS)
+        driver.cdp.clear()
+
+        for _ in range(5):
+            assert block_urls(driver, list(DEFAULT_BLOCKED_URLS))
+
+        assert driver.cdp == []
+
+    def test_lifting_sends_one_command(self):
+        driver = FakeCdpDriver()
+        block_urls(driver, ["*.png"])
+        driver.cdp.clear()
+
+        block_urls(driver, ())
+        block_urls(driver, ())
+
+        assert driver.cdp == [("Network.setBlockedURLs", {"urls": []})]
+
+    def test_nothing_blocked_sends_nothing(self):
+        driver = FakeCdpDriver()
+
+        assert block_urls(driver, ())
+
+        assert driver.cdp == []
+
+    def test_driver_without_devtools(self):
+        assert block_urls(object(), ["*.png"]) is False
+
+
+class FakeRemote:
+    """Stands in for webdriver.Remote; keeps what it was built with, opens no session."""
+
+    def __init__(self, command_executor, options):
+        self.command_executor = command_executor
+        self.options = options
+        self.maximized = False
+
+    def maximize_window(self):
+        self.maximized = True
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    monkeypatch.setattr(driver_factory.webdriver, "Remote", FakeRemote)
+
+
+class TestParseCapability:
+
+    @pytest.mark.parametrize("spec, expected", [
+        ("browserVersion=126", ("browserVersion", 126)),
+        ("se:recordVideo=true", ("se:recordVideo", True)),
+        ('se:name="checkout run"', ("se:name", "checkout run")),
+        ('sauce:options={"build": "42"}', ("sauce:options", {"build": "42"})),
+        ("platformName=linux", ("platformName", "linux")),
+        ("se:name=a=b", ("se:name", "a=b")),
+        ("se:name=", ("se:name", "")),
+        (" browserVersion =126", ("browserVersion", 126)),
+    ])
+    def test_parses_key_and_value(self, spec, expected):
+        assert parse_capability(spec) == expected
+
+    @pytest.mark.parametrize("spec", ["", "browserVersion", "=126", "  =126"])
+    def test_rejects_malformed_spec(self, spec):
+        with pytest.raises(ValueError, match="Expected key=value"):
+            parse_capability(spec)
+
+
+class TestCreateRemoteDriver:
+
+    def test_connection_is_keep_alive_with_pool(self, remote):
+        driver = create_remote_driver("http://grid:4444", "chrome", pool_size=4, timeout=30)
+
+        connection = driver.command_executor
+        config = connection._client_config
+        assert config.remote_server_addr == "http://grid:4444"
+        assert config.keep_alive
+        assert config.timeout == 30
+        # the nested key is what RemoteConnection hands to urllib3
+        assert connection._conn.connection_pool_kw["maxsize"] == 4
+
+    def test_default_pool_size(self, remote):
+        driver = create_remote_driver("http://grid:4444", "chrome")
+        assert driver.command_executor._conn.connection_pool_kw["maxsize"] == GRID_POOL_SIZE
+
+    def test_extra_capabilities_are_applied(self, remote):
+        driver = create_remote_driver(
+            "http://grid:4444", "edge", profile="lean",
+            capabilities={"browserVersion": 126, "se:recordVideo": True},
+        )
+
+        caps = driver.options.to_capabilities()
+        assert caps["browserName"] == "MicrosoftEdge"
+        assert caps["browserVersion"] == 126
+        assert caps["se:recordVideo"] is True
+
+    def test_only_full_profile_maximizes(self, remote):
+        assert create_remote_driver("http://grid:4444", "chrome").maximized
+        assert not create_remote_driver("http://grid:4444", "chrome", profile="headless").maximized
+
+    def test_rejects_empty_pool(self, remote):
+        with pytest.raises(ValueError, match="Invalid pool size"):
+            create_remote_driver("http://grid:4444", "chrome", pool_size=0)
@@ -0,0 +1,45 @@
+import pytest
+
+from src.pages.base_page import BasePage
+
+
+class FakeDriver:
+    """Serves the item index script a fixed list of (name, element) rows."""
+
+    def __init__(self, names):
+        self.rows = [[name, f"element:{name}"] for name in names]
+
+    def execute_script(self, script, *args):
+        if script is BasePage._INDEX_SCRIPT:
+            return [["page", 0], self.rows]
+        return ["page", 0]
+
+
+def find(names, item_name):
+    page = BasePage(FakeDriver(names))
+    return page.find_indexed_item("inventory_item", "inventory_item_name", item_name)
+
+
+class TestFindIndexedItem:
+
+    def test_exact_name_ignores_case_and_spacing(self):
+        assert find(["Sauce Labs  Backpack"], "sauce labs backpack") == "element:Sauce Labs  Backpack"
+
+    def test_partial_name_matches_first_in_dom_order(self):
+        assert find(["Bolt T-Shirt", "Red T-Shirt"], "t-shirt") == "element:Bolt T-Shirt"
+
+    def test_unknown_name(self):
+        assert find(["Bolt T-Shirt"], "Jacket") is None
+
+    @pytest.mark.parametrize("requested, found", [
+        ("STRAßE JACKET", True),
+        ("straße jacket", True),
+        # casefold() would map "ß" to "ss"; the in-page toLowerCase() does not
+        ("STRASSE JACKET", False),
+    ])
+    def test_matches_like_the_batch_click_script(self, requested, found):
+        assert (find(["Straße Jacket"], requested) is not None) is found
+
+    def test_normalize_name_lowercases_like_javascript(self):
+        # Expected values are what norm() in _BATCH_CLICK_SCRIPT returns for the same input
+        assert BasePage._normalize_name("  ẞIG\tİstanbul ") == "ßig i̇stanbul"
@@ -0,0 +1,255 @@
+import pytest
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from src.pages import base_page
+from src.pages.base_page import BasePage
+from src.utils import retry
+from src.utils.retry import RetryPolicy
+
+LOCATOR = ("id", "target")
+
+
+class FakeElement:
+    """Stands in for a WebElement; ``failures`` are raised by the next click() calls in turn.
+
+    ``current`` is what the element cache probe reports: still attached and
+    still the first match for its locator.
+    """
+
+    def __init__(self, failures=(), displayed=True, enabled=True, text="label"):
+        self.failures = list(failures)
+        self.displayed = displayed
+        self.enabled = enabled
+        self.current = True
+        self.text = text
+        self.clicks = 0
+
+    def click(self):
+        if self.failures:
+            raise self.failures.pop(0)("fake")
+        self.clicks += 1
+
+    def is_displayed(self):
+        return self.displayed
+
+    def is_enabled(self):
+        return self.enabled
+
+
+class FakeDriver:
+    """Answers the element cache probe from the fake elements' own state."""
+
+    def __init__(self):
+        self.probes = 0
+
+    def execute_script(self, script, entries):
+        self.probes += 1
+        return ["page", [
+            [el.current, el.current and el.displayed, el.current and el.enabled]
+            for el, _by, _value in entries
+        ]]
+
+
+@pytest.fixture
+def page(monkeypatch):
+    screenshots = []
+    monkeypatch.setattr(base_page, "capture_failure", lambda driver, label: screenshots.append(label))
+    page = BasePage(FakeDriver())
+    page.retry_policy = RetryPolicy(attempts=3, backoff=0)
+    page.screenshots = screenshots
+    return page
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    """Queue elements for wait_clickable/wait_visible to return; records each wait made."""
+    queue, calls = [], []
+
+    def wait(driver, locator):
+        calls.append(locator)
+        element = queue.pop(0)
+        if isinstance(element, type) and issubclass(element, Exception):
+            raise element("fake")
+        return element
+
+    monkeypatch.setattr(base_page, "wait_clickable", wait)
+    monkeypatch.setattr(base_page, "wait_visible", wait)
+    return queue, calls
+
+
+def stats(page, name="click"):
+    return page.driver.operation_metrics.report()[name]
+
+
+class TestRetryPolicy:
+
+    def test_delay_doubles_within_jitter(self):
+        policy = RetryPolicy(backoff=0.1, jitter=0.5)
+        for retry, base in ((1, 0.1), (2, 0.2), (3, 0.4)):
+            for _ in range(50):
+                assert base * 0.5 <= policy.delay(retry) <= base * 1.5
+
+    def test_delay_without_jitter_is_exact(self):
+        assert RetryPolicy(backoff=0.05, jitter=0).delay(3) == pytest.approx(0.2)
+
+    def test_pause_sleeps_for_delay(self, monkeypatch):
+        slept = []
+        monkeypatch.setattr(retry.time, "sleep", slept.append)
+
+        RetryPolicy(backoff=0.05, jitter=0).pause(2)
+
+        assert slept == [pytest.approx(0.1)]
+
+    def test_delay_never_negative(self):
+        assert RetryPolicy(backoff=0.1, jitter=2.0).delay(1) >= 0
+
+    def test_rejects_zero_attempts(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(attempts=0)
+
+
+class TestOperate:
+
+    def test_retries_stale_element_then_succeeds(self, page, waits):
+        queue, calls = waits
+        fresh = FakeElement()
+        queue.extend([FakeElement([StaleElementReferenceException]), fresh])
+
+        page.click(*LOCATOR)
+
+        assert fresh.clicks == 1
+        assert len(calls) == 2
+        assert stats(page)["calls"] == 1
+        assert stats(page)["retries"] == 1
+        assert stats(page)["failures"] == 0
+
+    def test_gives_up_after_policy_attempts(self, page, waits):
+        queue, calls = waits
+        element = FakeElement([StaleElementReferenceException] * 5)
+        queue.extend([element] * 3)
+
+        with pytest.raises(StaleElementReferenceException):
+            page.click(*LOCATOR)
+
+        assert len(calls) == 3
+        assert stats(page)["retries"] == 2
+        assert stats(page)["failures"] == 1
+        assert page.screenshots == ["target"]
+
+    def test_non_retryable_error_is_recorded_and_captured(self, page, waits):
+        queue, _calls = waits
+        queue.append(FakeElement([ElementNotInteractableException]))
+
+        with pytest.raises(ElementNotInteractableException):
+            page.click(*LOCATOR)
+
+        assert stats(page)["failures"] == 1
+        assert stats(page)["retries"] == 0
+        assert page.screenshots == ["target"]
+
+    def test_timeout_raises_with_locator_message(self, page, waits):
+        queue, _calls = waits
+        queue.append(TimeoutException)
+
+        with pytest.raises(TimeoutException, match=r"not clickable with locator: \(id, target\)"):
+            page.click(*LOCATOR)
+
+        assert stats(page)["failures"] == 1
+        assert page.screenshots == ["target"]
+
+    def test_reuses_handle_for_same_locator(self, page, waits):
+        queue, calls = waits
+        element = FakeElement()
+        queue.append(element)
+
+        page.click(*LOCATOR)
+        page.click(*LOCATOR)
+
+        assert element.clicks == 2
+        assert len(calls) == 1
+        assert stats(page)["handle_reuses"] == 1
+
+    def test_does_not_reuse_handle_for_other_locator(self, page, waits):
+        queue, calls = waits
+        queue.extend([FakeElement(), FakeElement()])
+
+        page.click(*LOCATOR)
+        page.click("id", "other")
+
+        assert len(calls) == 2
+
+    def test_disabled_handle_is_not_reused_for_click(self, page, waits):
+        queue, calls = waits
+        first, second = FakeElement(), FakeElement()
+        queue.extend([first, second])
+
+        page.click(*LOCATOR)
+        first.enabled = False
+        page.click(*LOCATOR)
+
+        assert (first.clicks, second.clicks) == (1, 1)
+        assert len(calls) == 2
+
+    def test_rerendered_handle_is_not_reused(self, page, waits):
+        queue, calls = waits
+        first, second = FakeElement(), FakeElement()
+        queue.extend([first, second])
+
+        page.click(*LOCATOR)
+        first.current = False  # e.g. a list re-rendered and another row is now first
+        page.click(*LOCATOR)
+
+        assert (first.clicks, second.clicks) == (1, 1)
+        assert len(calls) == 2
+        assert stats(page)["handle_reuses"] == 0
+
+    def test_reuse_costs_one_probe(self, page, waits):
+        queue, _calls = waits
+        queue.append(FakeElement())
+
+        page.click(*LOCATOR)
+        page.click(*LOCATOR)
+
+        assert page.driver.probes == 1
+
+    def test_hidden_handle_is_not_reused_for_text(self, page, waits):
+        queue, calls = waits
+        first = FakeElement(text="")
+        queue.extend([first, TimeoutException])
+
+        page.ele_text(*LOCATOR)
+        first.displayed = False
+        with pytest.raises(TimeoutException):
+            page.ele_text(*LOCATOR)
+
+        assert len(calls) == 2
+
+    def test_stale_reused_handle_falls_back_without_retry(self, page, waits):
+        queue, calls = waits
+        first, second = FakeElement(), FakeElement()
+        queue.extend([first, second])
+
+        page.click(*LOCATOR)
+        first.failures.append(StaleElementReferenceException)
+        page.click(*LOCATOR)
+
+        assert second.clicks == 1
+        assert len(calls) == 2
+        assert stats(page)["retries"] == 0
+
+    def test_blocked_reused_handle_is_not_tried_twice(self, page, waits):
+        queue, calls = waits
+        first = FakeElement()
+        queue.extend([first, FakeElement([ElementNotInteractableException])])
+
+        page.click(*LOCATOR)
+        first.failures.append(ElementNotInteractableException)
+        with pytest.raises(ElementNotInteractableException):
+            page.click(*LOCATOR)
+
+        assert len(calls) == 2
+        assert stats(page)["failures"] == 1
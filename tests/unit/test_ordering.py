@@ -0,0 +1,168 @@
+import itertools
+import random
+
+import pytest
+
+from src.utils.ordering import (
+    LOGGED_IN,
+    LOGGED_OUT,
+    MODULE_START,
+    StartState,
+    count_transitions,
+    reorder,
+    required_state,
+    transition_cost,
+)
+
+
+class FakeMarker:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class FakeParent:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+class FakeItem:
+    """The parts of a pytest Item that ordering reads."""
+
+    def __init__(self, name, fixtures=(), parent="tests/test_mod.py::TestCase", **start_state):
+        self.parent = FakeParent(parent)
+        self.nodeid = f"{parent}::{name}"
+        self.fixturenames = list(fixtures)
+        self.marker = FakeMarker(**start_state) if start_state else None
+
+    def get_closest_marker(self, name):
+        return self.marker if name == "start_state" else None
+
+
+def logged_in(name, **kwargs):
+    return FakeItem(name, fixtures=("app_login",), **kwargs)
+
+
+def logged_out(name, **kwargs):
+    return FakeItem(name, **kwargs)
+
+
+def names(items):
+    return [item.nodeid[len(item.parent.nodeid) + 2:] for item in items]
+
+
+class TestRequiredState:
+
+    def test_app_login_means_logged_in(self):
+        assert required_state(logged_in("t")) == StartState(LOGGED_IN, None)
+
+    def test_clean_cart_means_logged_in(self):
+        assert required_state(FakeItem("t", fixtures=("clean_cart",))).auth == LOGGED_IN
+
+    def test_no_state_fixture_means_logged_out(self):
+        assert required_state(FakeItem("t", fixtures=("login_page",))) == StartState(LOGGED_OUT, None)
+
+    def test_marker_overrides_auth_and_sets_page(self):
+        item = logged_out("t", auth=LOGGED_IN, page="cart")
+        assert required_state(item) == StartState(LOGGED_IN, "cart")
+
+    def test_marker_page_only_keeps_derived_auth(self):
+        assert required_state(logged_in("t", page="cart")) == StartState(LOGGED_IN, "cart")
+
+
+class TestTransitionCost:
+
+    @pytest.mark.parametrize("current, target, cost", [
+        (MODULE_START, StartState(LOGGED_OUT, None), 0),
+        (MODULE_START, StartState(LOGGED_IN, None), 1),
+        (StartState(LOGGED_IN, "cart"), StartState(LOGGED_IN, None), 0),
+        (StartState(LOGGED_IN, "cart"), StartState(LOGGED_IN, "cart"), 0),
+        (StartState(LOGGED_IN, None), StartState(LOGGED_IN, "cart"), 1),
+        (StartState(LOGGED_OUT, None), StartState(LOGGED_IN, "cart"), 2),
+    ])
+    def test_cost(self, current, target, cost):
+        assert transition_cost(current, target) == cost
+
+
+class TestCountTransitions:
+
+    def test_alternating_states_cost_each_switch(self):
+        items = [logged_in("a"), logged_out("b"), logged_in("c")]
+        assert count_transitions(items) == 3
+
+    def test_each_scope_restarts_logged_out(self):
+        items = [
+            logged_in("a", parent="tests/test_one.py"),
+            logged_in("b", parent="tests/test_two.py"),
+        ]
+        assert count_transitions(items) == 2
+
+
+class TestReorder:
+
+    def test_groups_shared_start_states(self):
+        items = [logged_in("a"), logged_out("b"), logged_in("c"), logged_out("d")]
+
+        ordered = reorder(items)
+
+        assert names(ordered) == ["b", "d", "a", "c"]
+        assert count_transitions(ordered) == 1
+
+    def test_ties_keep_file_order(self):
+        items = [logged_out("a"), logged_out("b"), logged_out("c")]
+        assert names(reorder(items)) == ["a", "b", "c"]
+
+    def test_items_never_cross_scopes(self):
+        items = [
+            logged_in("a", parent="tests/test_one.py"),
+            logged_out("b", parent="tests/test_one.py"),
+            logged_out("c", parent="tests/test_two.py"),
+            logged_in("d", parent="tests/test_two.py"),
+        ]
+
+        ordered = reorder(items)
+
+        assert [item.parent.nodeid for item in ordered] == [
+            "tests/test_one.py", "tests/test_one.py", "tests/test_two.py", "tests/test_two.py",
+        ]
+
+    def test_parametrized_ids_containing_separator_stay_in_scope(self):
+        parent = "tests/test_mod.py::TestCase"
+        items = [
+            logged_in("test_x[a::b]", parent=parent),
+            logged_out("test_y", parent=parent),
+            logged_in("test_x[c::d]", parent=parent),
+        ]
+
+        ordered = reorder(items)
+
+        assert names(ordered) == ["test_y", "test_x[a::b]", "test_x[c::d]"]
+
+    def test_is_a_permutation(self):
+        items = [logged_in("a"), logged_out("b", page="cart"), logged_in("c", page="cart")]
+        assert sorted(names(reorder(items))) == ["a", "b", "c"]
+
+    def test_transition_count_never_increases_exhaustive(self):
+        kinds = [
+            lambda n: logged_out(n),
+            lambda n: logged_in(n),
+            lambda n: logged_in(n, page="cart"),
+            lambda n: logged_out(n, page="login"),
+        ]
+        for length in range(1, 6):
+            for combo in itertools.product(range(len(kinds)), repeat=length):
+                items = [kinds[k](f"t{i}") for i, k in enumerate(combo)]
+                assert count_transitions(reorder(items)) <= count_transitions(items), combo
+
+    def test_transition_count_never_increases_random(self):
+        rng = random.Random(1234)
+        pages = [None, "cart", "inventory", "checkout"]
+        for _ in range(300):
+            items = []
+            for i in range(rng.randint(1, 12)):
+                parent = f"tests/test_{rng.randint(0, 2)}.py"
+                factory = logged_in if rng.random() < 0.5 else logged_out
+                page = rng.choice(pages)
+                items.append(factory(f"t{i}", parent=parent, **({"page": page} if page else {})))
+            items.sort(key=lambda item: item.parent.nodeid)
+
+            assert count_transitions(reorder(items)) <= count_transitions(items)
@@ -0,0 +1,185 @@
+import dataclasses
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from src.utils import waits
+
+LOCATOR = ("id", "target")
+
+
+class FakeClock:
+    """Replaces the ``time`` module in waits; sleeping advances the clock instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeDriver:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def config():
+    """Restore the global wait config and latency stats after each test."""
+    saved = dataclasses.replace(waits.CONFIG)
+    waits.reset_latency_stats()
+    yield waits.CONFIG
+    waits.configure(**dataclasses.asdict(saved))
+    waits.reset_latency_stats()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(waits, "time", clock)
+    return clock
+
+
+def ready_after(checks, value="done"):
+    """Condition that is falsy for ``checks`` calls, then returns ``value``."""
+    calls = []
+
+    def condition(driver):
+        calls.append(driver)
+        return value if len(calls) > checks else False
+    condition.calls = calls
+    return condition
+
+
+class TestUntil:
+
+    def test_immediate_success_never_sleeps(self, clock):
+        assert waits._until(FakeDriver(), ready_after(0), 5, "thing") == "done"
+        assert clock.sleeps == []
+
+    def test_poll_interval_backs_off_to_max_poll(self, clock, config):
+        waits.configure(initial_poll=0.005, backoff=2.0, max_poll=0.04)
+
+        waits._until(FakeDriver(), ready_after(6), 5, "thing")
+
+        assert clock.sleeps == pytest.approx([0.005, 0.01, 0.02, 0.04, 0.04, 0.04])
+
+    def test_last_sleep_is_clamped_to_deadline(self, clock, config):
+        waits.configure(initial_poll=0.4, backoff=1.0, max_poll=0.4)
+
+        with pytest.raises(TimeoutException, match=r"Timed out after 1s waiting for thing"):
+            waits._until(FakeDriver(), ready_after(100), 1, "thing")
+
+        assert clock.sleeps == pytest.approx([0.4, 0.4, 0.2])
+        assert clock.now == pytest.approx(1)
+
+    def test_ignored_exceptions_keep_polling(self, clock):
+        attempts = []
+
+        def condition(driver):
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise NoSuchElementException("fake")
+            return "found"
+
+        assert waits._until(FakeDriver(), condition, 5, "thing") == "found"
+        assert len(clock.sleeps) == 2
+
+    def test_other_exceptions_propagate(self, clock):
+        def condition(driver):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            waits._until(FakeDriver(), condition, 5, "thing")
+
+    def test_success_is_learned_per_locator(self, clock):
+        waits._until(FakeDriver(), ready_after(2), 5, "thing", locator=LOCATOR)
+
+        stats = waits.latency_stats()[LOCATOR]
+        assert stats["count"] == 1
+        assert stats["max"] == pytest.approx(sum(clock.sleeps))
+
+    def test_timeout_is_not_learned(self, clock):
+        with pytest.raises(TimeoutException):
+            waits._until(FakeDriver(), ready_after(100), 1, "thing", locator=LOCATOR)
+
+        assert waits.latency_stats() == {}
+
+
+class TestAdaptiveTimeouts:
+
+    def test_explicit_timeout_always_wins(self, config):
+        waits.configure(adaptive_timeouts=True)
+        waits._learn(LOCATOR, 0.1)
+        assert waits._timeout_for(LOCATOR, 7) == 7
+
+    def test_off_uses_global_timeout(self, config):
+        waits._learn(LOCATOR, 0.1)
+        assert waits._timeout_for(LOCATOR, None) == config.timeout
+
+    def test_unseen_locator_uses_global_timeout(self, config):
+        waits.configure(adaptive_timeouts=True)
+        assert waits._timeout_for(LOCATOR, None) == config.timeout
+
+    @pytest.mark.parametrize("slowest, expected", [
+        (0.1, 2.0),   # 0.3s learned, raised to min_learned_timeout
+        (1.0, 3.0),   # factor x slowest
+        (5.0, 10),    # 15s learned, capped at the global timeout
+    ])
+    def test_learned_timeout_is_clamped(self, config, slowest, expected):
+        waits.configure(
+            adaptive_timeouts=True, timeout=10, learned_timeout_factor=3.0, min_learned_timeout=2.0,
+        )
+        waits._learn(LOCATOR, slowest / 2)
+        waits._learn(LOCATOR, slowest)
+
+        assert waits._timeout_for(LOCATOR, None) == pytest.approx(expected)
+
+    def test_until_fails_at_learned_timeout(self, clock, config):
+        waits.configure(adaptive_timeouts=True, timeout=10, min_learned_timeout=2.0)
+        waits._learn(LOCATOR, 0.1)
+
+        with pytest.raises(TimeoutException, match=r"after 2\.0s"):
+            waits._until(FakeDriver(), ready_after(10_000), None, "thing", locator=LOCATOR)
+
+        assert clock.now == pytest.approx(2.0)
+
+
+class TestLatencyStats:
+
+    def test_tracks_count_max_and_total(self):
+        waits._learn(LOCATOR, 0.2)
+        waits._learn(LOCATOR, 0.5)
+        waits._learn(LOCATOR, 0.1)
+
+        assert waits.latency_stats()[LOCATOR] == pytest.approx({"count": 3, "max": 0.5, "total": 0.8})
+
+    def test_returns_a_copy(self):
+        waits._learn(LOCATOR, 0.2)
+        waits.latency_stats()[LOCATOR]["max"] = 99
+        assert waits.latency_stats()[LOCATOR]["max"] == 0.2
+
+    def test_reset_clears_everything(self):
+        waits._learn(LOCATOR, 0.2)
+        waits.reset_latency_stats()
+        assert waits.latency_stats() == {}
+
+
+class TestConfigure:
+
+    def test_updates_and_returns_global_config(self):
+        assert waits.configure(max_poll=0.1) is waits.CONFIG
+        assert waits.CONFIG.max_poll == 0.1
+
+    def test_rejects_unknown_setting(self):
+        with pytest.raises(ValueError, match="Unknown wait setting: 'poll_interval'"):
+            waits.configure(poll_interval=1)
+
+    def test_rejects_invalid_mode(self):
+        with pytest.raises(ValueError, match="Invalid wait mode: 'magic'"):
+            waits.configure(mode="magic")
+        assert waits.CONFIG.mode in waits.WAIT_MODES